@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import lru_cache
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, SystemMessage
@@ -12,7 +13,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from src.agent.state import AgentState
 from src.db import get_session_factory
 from src.embeddings.service import find_similar_evaluations
-from src.evaluator import DimensionScore, SubCriterionResult, TCREIFlags
+from src.evaluator import DIMENSION_NAMES, DimensionScore, SubCriterionResult, TCREIFlags
 from src.evaluator.criteria import get_criteria_for_task_type
 from src.evaluator.exceptions import AnalysisError, format_fatal_error, is_fatal_llm_error
 from src.evaluator.llm_schemas import AnalysisLLMResponse
@@ -29,9 +30,13 @@ _CHUNK_CONCURRENCY = 5
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
 def _build_criteria_description(task_type: str = "general") -> str:
     """Build a structured description of all criteria for the LLM.
 
+    The criteria are module-level constants, so the rendered text is cached
+    per task type instead of being rebuilt for every prompt and chunk.
+
     Args:
         task_type: The task type string ("general", "email_writing", or "summarization").
 
@@ -56,7 +61,7 @@ def _map_analysis_response(response: AnalysisLLMResponse) -> dict:
         Dict with ``dimensions`` (list of DimensionScore) and ``tcrei_flags``.
     """
     dimensions = []
-    for dim_name in ["task", "context", "references", "constraints"]:
+    for dim_name in DIMENSION_NAMES:
         dim_data = response.dimensions.get(dim_name)
         if dim_data is None:
             dimensions.append(DimensionScore(name=dim_name, score=0, sub_criteria=[]))
@@ -421,7 +426,7 @@ def _empty_analysis() -> dict:
     """
     dimensions = [
         DimensionScore(name=name, score=0, sub_criteria=[])
-        for name in ["task", "context", "references", "constraints"]
+        for name in DIMENSION_NAMES
     ]
     return {
         "dimensions": dimensions,
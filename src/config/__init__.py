@@ -153,6 +153,14 @@ class Settings(BaseSettings):
         return self.database_url
 
 
+# (os.environ name, Settings attribute) pairs propagated by get_settings()
+_LANGSMITH_ENV_VARS: tuple[tuple[str, str], ...] = (
+    ("LANGCHAIN_TRACING_V2", "langchain_tracing_v2"),
+    ("LANGCHAIN_API_KEY", "langchain_api_key"),
+    ("LANGCHAIN_PROJECT", "langchain_project"),
+)
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance.
@@ -171,10 +179,12 @@ def get_settings() -> Settings:
     # LangChain/LangSmith SDK reads these directly from os.environ.
     # pydantic-settings loads them from .env but doesn't write them back,
     # so we propagate them here.
-    os.environ.setdefault("LANGCHAIN_TRACING_V2", str(settings.langchain_tracing_v2).lower())
-    if settings.langchain_api_key:
-        os.environ.setdefault("LANGCHAIN_API_KEY", settings.langchain_api_key)
-    if settings.langchain_project:
-        os.environ.setdefault("LANGCHAIN_PROJECT", settings.langchain_project)
+    # Booleans are always written ("true"/"false"); unset strings are skipped.
+    for env_name, attr in _LANGSMITH_ENV_VARS:
+        value = getattr(settings, attr)
+        if isinstance(value, bool):
+            value = str(value).lower()
+        if value:
+            os.environ.setdefault(env_name, value)
 
     return settings
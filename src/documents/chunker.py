@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
@@ -11,6 +12,9 @@ from src.documents.models import DocumentChunk
 
 logger = logging.getLogger(__name__)
 
+# Slide/sheet section markers emitted by the PPTX and XLSX loaders
+_PAGE_MARKER_RE = re.compile(r"## (?:Slide|Sheet)")
+
 
 def chunk_document(
     text: str,
@@ -95,16 +99,13 @@ def _estimate_page_number(text: str, offset: int) -> int | None:
     Returns:
         Estimated page number, or None if not determinable.
     """
-    prefix = text[:offset]
     # Count form feed characters (PDF page breaks)
-    ff_count = prefix.count("\f")
+    ff_count = text.count("\f", 0, offset)
     if ff_count > 0:
         return ff_count + 1
 
     # Count slide/sheet markers
-    import re
-
-    markers = re.findall(r"## (?:Slide|Sheet)", prefix)
+    markers = _PAGE_MARKER_RE.findall(text, 0, offset)
     if markers:
         return len(markers)
 
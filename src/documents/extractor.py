@@ -5,15 +5,23 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
 from src.config import get_settings
 from src.documents.models import ExtractionEntity
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = logging.getLogger(__name__)
 
 # Maximum characters per extraction window
 _WINDOW_SIZE = 5000
 _WINDOW_OVERLAP = 500
+# Maximum windows extracted concurrently (bounds in-flight LLM requests)
+_EXTRACTION_CONCURRENCY = 5
 
 
 async def extract_entities(raw_text: str) -> list[ExtractionEntity]:
@@ -21,7 +29,7 @@ async def extract_entities(raw_text: str) -> list[ExtractionEntity]:
 
     For documents that exceed a single extraction window, splits the text
     into overlapping windows, extracts entities from each window in parallel
-    (Map phase), then merges and deduplicates results (Reduce phase).
+    (Map phase, up to ``_EXTRACTION_CONCURRENCY`` at a time), then merges and deduplicates results (Reduce phase).
 
     This ensures no information is lost — the entire document is processed.
 
@@ -49,23 +57,29 @@ async def extract_entities(raw_text: str) -> list[ExtractionEntity]:
     )
 
     # MAP phase: extract entities from each window in parallel
-    tasks = [_extract_from_window(window, idx, len(windows)) for idx, window in enumerate(windows)]
+    semaphore = asyncio.Semaphore(_EXTRACTION_CONCURRENCY)
+
+    async def _bounded(window: str, idx: int) -> list[ExtractionEntity]:
+        async with semaphore:
+            return await _extract_from_window(window, idx, len(windows))
+
+    tasks = [_bounded(window, idx) for idx, window in enumerate(windows)]
     window_results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    # Collect all extracted entities
-    all_entities: list[ExtractionEntity] = []
+    # Collect the successful window results
+    succeeded: list[list[ExtractionEntity]] = []
     for i, result in enumerate(window_results):
         if isinstance(result, BaseException):
             logger.warning("Window %d extraction failed: %s", i, result)
             continue
-        all_entities.extend(result)
+        succeeded.append(result)
 
-    # REDUCE phase: deduplicate entities
-    merged = _deduplicate_entities(all_entities)
+    # REDUCE phase: deduplicate entities straight from the per-window lists
+    merged = _deduplicate_entities(chain.from_iterable(succeeded))
 
     logger.info(
         "MapReduce extraction complete: %d raw entities -> %d deduplicated",
-        len(all_entities),
+        sum(map(len, succeeded)),
         len(merged),
     )
     return merged
@@ -85,16 +99,8 @@ def _split_into_windows(text: str, window_size: int, overlap: int) -> list[str]:
     if len(text) <= window_size:
         return [text]
 
-    windows: list[str] = []
-    start = 0
-    while start < len(text):
-        end = start + window_size
-        windows.append(text[start:end])
-        start += window_size - overlap
-        if start >= len(text):
-            break
-
-    return windows
+    stride = window_size - overlap
+    return [text[start : start + window_size] for start in range(0, len(text), stride)]
 
 
 async def _extract_from_window(text: str, window_idx: int, total_windows: int) -> list[ExtractionEntity]:
@@ -180,7 +186,7 @@ async def _extract_from_window(text: str, window_idx: int, total_windows: int) -
         return []
 
 
-def _deduplicate_entities(entities: list[ExtractionEntity]) -> list[ExtractionEntity]:
+def _deduplicate_entities(entities: Iterable[ExtractionEntity]) -> list[ExtractionEntity]:
     """Deduplicate entities by (type, normalized_value), keeping highest confidence.
 
     Args:
@@ -198,4 +204,4 @@ def _deduplicate_entities(entities: list[ExtractionEntity]) -> list[ExtractionEn
             seen[key] = entity
 
     # Sort by confidence descending
-    return sorted(seen.values(), key=lambda e: e.confidence, reverse=True)
+    return sorted(seen.values(), key=attrgetter("confidence"), reverse=True)
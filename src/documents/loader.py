@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import csv
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,10 +14,15 @@ from src.documents.exceptions import DocumentProcessingError, UnsupportedFormatE
 from src.documents.models import DocumentMetadata
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from langchain_core.documents import Document as LCDocument
 
 logger = logging.getLogger(__name__)
 
+# Default number of documents loaded at once by load_documents()
+_LOAD_CONCURRENCY = 8
+
 # Supported document extensions and their loader types
 SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(
     {
@@ -34,8 +40,9 @@ def _count_words(text: str) -> int:
     return len(text.split())
 
 
+@lru_cache(maxsize=1)
 def _pdfplumber_available() -> bool:
-    """Check whether pdfplumber is installed."""
+    """Check whether pdfplumber is installed (probed once per process)."""
     try:
         import pdfplumber  # noqa: F401
 
@@ -44,8 +51,9 @@ def _pdfplumber_available() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def _pymupdf_available() -> bool:
-    """Check whether PyMuPDF (fitz) is installed."""
+    """Check whether PyMuPDF (fitz) is installed (probed once per process)."""
     try:
         import fitz  # noqa: F401
 
@@ -163,6 +171,39 @@ async def load_document(file_path: Path, filename: str | None = None) -> tuple[s
     return text, metadata
 
 
+async def load_documents(
+    documents: Sequence[tuple[Path, str | None]],
+    *,
+    concurrency: int = _LOAD_CONCURRENCY,
+) -> list[tuple[str, DocumentMetadata]]:
+    """Load several documents concurrently, up to ``concurrency`` at a time.
+
+    Format-specific parsing already runs in worker threads, so loading a
+    batch this way overlaps decoding of independent files.
+
+    Args:
+        documents: ``(file_path, filename)`` pairs, as accepted by ``load_document``.
+        concurrency: Maximum number of documents loaded at once.
+
+    Returns:
+        ``(extracted_text, metadata)`` tuples in the same order as ``documents``.
+
+    Raises:
+        ExceptionGroup: If any document fails to load; the remaining loads are
+            cancelled and the group wraps the ``UnsupportedFormatError`` /
+            ``DocumentProcessingError`` instances raised.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _load_one(file_path: Path, filename: str | None) -> tuple[str, DocumentMetadata]:
+        async with semaphore:
+            return await load_document(file_path, filename)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_load_one(path, name)) for path, name in documents]
+    return [task.result() for task in tasks]
+
+
 async def _load_pdf(file_path: Path) -> tuple[str, int | None, dict[str, str]]:
     """Load a PDF file with tiered OCR fallback.
 
@@ -179,6 +220,7 @@ async def _load_pdf(file_path: Path) -> tuple[str, int | None, dict[str, str]]:
 
     tiers_attempted: list[str] = []
     best_text = ""
+    best_len = 0  # len(best_text.strip()), kept alongside so each tier's text is stripped once
     best_method = "pypdf"
     page_count: int | None = None
 
@@ -193,8 +235,9 @@ async def _load_pdf(file_path: Path) -> tuple[str, int | None, dict[str, str]]:
         text_parts = [page.page_content for page in pages if page.page_content.strip()]
         tier1_text = "\f\n\n".join(text_parts)
         tiers_attempted.append("pypdf")
+        tier1_len = len(tier1_text.strip())
 
-        if len(tier1_text.strip()) >= threshold:
+        if tier1_len >= threshold:
             extra_meta = {
                 "pdf_extraction_method": "pypdf",
                 "pdf_ocr_applied": "false",
@@ -202,10 +245,10 @@ async def _load_pdf(file_path: Path) -> tuple[str, int | None, dict[str, str]]:
             }
             return tier1_text, page_count, extra_meta
 
-        best_text = tier1_text
+        best_text, best_len = tier1_text, tier1_len
         logger.info(
             "PDF Tier 1 (pypdf) extracted %d chars (threshold %d) — trying fallback",
-            len(tier1_text.strip()),
+            tier1_len,
             threshold,
         )
     except Exception:
@@ -225,12 +268,13 @@ async def _load_pdf(file_path: Path) -> tuple[str, int | None, dict[str, str]]:
         try:
             tier2_text = await asyncio.to_thread(_extract_with_pdfplumber_sync, file_path)
             tiers_attempted.append("pdfplumber")
+            tier2_len = len(tier2_text.strip())
 
-            if len(tier2_text.strip()) > len(best_text.strip()):
-                best_text = tier2_text
+            if tier2_len > best_len:
+                best_text, best_len = tier2_text, tier2_len
                 best_method = "pdfplumber"
 
-            if len(best_text.strip()) >= threshold:
+            if best_len >= threshold:
                 extra_meta = {
                     "pdf_extraction_method": "pdfplumber",
                     "pdf_ocr_applied": "false",
@@ -240,7 +284,7 @@ async def _load_pdf(file_path: Path) -> tuple[str, int | None, dict[str, str]]:
 
             logger.info(
                 "PDF Tier 2 (pdfplumber) extracted %d chars — trying OCR fallback",
-                len(tier2_text.strip()),
+                tier2_len,
             )
         except Exception:
             tiers_attempted.append("pdfplumber")
@@ -254,7 +298,7 @@ async def _load_pdf(file_path: Path) -> tuple[str, int | None, dict[str, str]]:
             tier3_text = await asyncio.to_thread(_extract_with_pymupdf_ocr_sync, file_path)
             tiers_attempted.append("pymupdf_ocr")
 
-            if len(tier3_text.strip()) > len(best_text.strip()):
+            if len(tier3_text.strip()) > best_len:
                 best_text = tier3_text
                 best_method = "pymupdf_ocr"
 
@@ -333,13 +377,12 @@ async def _load_pptx(file_path: Path) -> tuple[str, int | None]:
     return "\n\n".join(text_parts), slide_count if slide_count else None
 
 
-async def _load_csv(file_path: Path) -> tuple[str, int | None]:
-    """Load a CSV file and convert to readable text."""
+def _read_csv_sync(file_path: Path) -> str:
+    """Render a CSV file as pipe-delimited lines (sync, called via asyncio.to_thread)."""
     with open(file_path, encoding="utf-8", errors="replace", newline="") as f:
-        reader = csv.reader(f)
-        rows: list[str] = []
-        for row in reader:
-            if any(cell.strip() for cell in row):
-                rows.append(" | ".join(row))
+        return "\n".join(" | ".join(row) for row in csv.reader(f) if any(cell.strip() for cell in row))
+
 
-    return "\n".join(rows), None
+async def _load_csv(file_path: Path) -> tuple[str, int | None]:
+    """Load a CSV file and convert to readable text."""
+    return await asyncio.to_thread(_read_csv_sync, file_path), None
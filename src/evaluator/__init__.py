@@ -51,6 +51,10 @@ class SubCriterionResult(BaseModel):
     detail: str
 
 
+# Canonical order of the scored T.C.R.E.I. dimensions in analysis results
+DIMENSION_NAMES: tuple[str, ...] = ("task", "context", "references", "constraints")
+
+
 class DimensionScore(BaseModel):
     """Score and analysis for a single T.C.R.E.I. dimension."""
 
@@ -84,6 +88,23 @@ class TCREIFlags(BaseModel):
     evaluate: bool = False
     iterate: bool = False
 
+    # Bit layout (field order): task=0, context=1, references=2, evaluate=3, iterate=4
+
+    def to_mask(self) -> int:
+        """Pack the flags into an int, bit ``i`` set for the ``i``-th field that is True."""
+        return self.task | self.context << 1 | self.references << 2 | self.evaluate << 3 | self.iterate << 4
+
+    @classmethod
+    def from_mask(cls, mask: int) -> TCREIFlags:
+        """Build flags from a bitmask produced by :meth:`to_mask`."""
+        return cls(
+            task=bool(mask & 1),
+            context=bool(mask & 2),
+            references=bool(mask & 4),
+            evaluate=bool(mask & 8),
+            iterate=bool(mask & 16),
+        )
+
 
 class EvaluationResult(BaseModel):
     """Complete evaluation output."""
@@ -6,6 +6,8 @@ Each criterion includes detection patterns and scoring guidance.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from src.evaluator.criteria.base import Criterion
 from src.evaluator.criteria.coding import (
     CODING_CONSTRAINTS_CRITERIA,
@@ -50,7 +52,10 @@ from src.evaluator.criteria.summarization import (
     SUMMARIZATION_TASK_CRITERIA,
 )
 
-_CRITERIA_REGISTRY: dict[str, dict[str, list[Criterion]]] = {
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_CRITERIA_REGISTRY: dict[str, Mapping[str, tuple[Criterion, ...]]] = {
     "email_writing": EMAIL_CRITERIA,
     "summarization": SUMMARIZATION_CRITERIA,
     "coding_task": CODING_CRITERIA,
@@ -59,7 +64,7 @@ _CRITERIA_REGISTRY: dict[str, dict[str, list[Criterion]]] = {
 }
 
 
-def get_criteria_for_task_type(task_type: str) -> dict[str, list[Criterion]]:
+def get_criteria_for_task_type(task_type: str) -> Mapping[str, tuple[Criterion, ...]]:
     """Return the criteria dict for the given task type.
 
     Args:
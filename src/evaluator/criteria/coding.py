@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from src.evaluator.criteria.base import Criterion
 
-CODING_TASK_CRITERIA = [
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+CODING_TASK_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="programming_language_specified",
         description="The prompt specifies which programming language, framework, or technology stack to use",
@@ -29,9 +35,9 @@ CODING_TASK_CRITERIA = [
         detection_hint="Look for: 'follow PEP 8', 'use type hints', 'add docstrings', 'write clean code', 'SOLID principles', 'DRY', 'include comments', 'production-ready', 'well-documented', 'idiomatic'",
         weight=0.20,
     ),
-]
+)
 
-CODING_CONTEXT_CRITERIA = [
+CODING_CONTEXT_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="project_context_provided",
         description="The prompt describes the project or application the code will be part of",
@@ -56,9 +62,9 @@ CODING_CONTEXT_CRITERIA = [
         detection_hint="Look for: 'integrate with our existing', 'extend the current', 'compatible with the existing API', 'add to the module', code snippets, import references, existing function/class names",
         weight=0.25,
     ),
-]
+)
 
-CODING_REFERENCES_CRITERIA = [
+CODING_REFERENCES_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="code_examples_provided",
         description="The prompt includes code examples, snippets, or pseudocode showing the expected approach or output format",
@@ -77,9 +83,9 @@ CODING_REFERENCES_CRITERIA = [
         detection_hint="Look for: 'should pass these tests', 'expected output for input X is Y', 'include unit tests', 'test cases', 'edge cases to handle', 'given-when-then', assertion examples",
         weight=0.30,
     ),
-]
+)
 
-CODING_CONSTRAINTS_CRITERIA = [
+CODING_CONSTRAINTS_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="error_handling_requirements",
         description="The prompt specifies how errors, edge cases, and invalid inputs should be handled",
@@ -104,11 +110,11 @@ CODING_CONSTRAINTS_CRITERIA = [
         detection_hint="Look for: 'do not implement', 'exclude authentication', 'no database logic', 'avoid using', 'don't add logging', 'skip the UI', 'out of scope', 'leave out'",
         weight=0.25,
     ),
-]
+)
 
-CODING_CRITERIA = {
+CODING_CRITERIA: Mapping[str, tuple[Criterion, ...]] = MappingProxyType({
     "task": CODING_TASK_CRITERIA,
     "context": CODING_CONTEXT_CRITERIA,
     "references": CODING_REFERENCES_CRITERIA,
     "constraints": CODING_CONSTRAINTS_CRITERIA,
-}
+})
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from src.evaluator.criteria.base import Criterion
 
-EMAIL_TASK_CRITERIA = [
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+EMAIL_TASK_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="email_action_specified",
         description="The prompt specifies the type of email action: write, reply, follow up, draft, forward, or compose",
@@ -29,9 +35,9 @@ EMAIL_TASK_CRITERIA = [
         detection_hint="Look for: 'include a subject line', 'professional greeting', 'sign off with', 'include a call to action', 'bullet points in the body', 'keep it to one paragraph'",
         weight=0.20,
     ),
-]
+)
 
-EMAIL_CONTEXT_CRITERIA = [
+EMAIL_CONTEXT_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="recipient_defined",
         description="The prompt specifies who will receive the email: their role, relationship to the sender, or name",
@@ -56,9 +62,9 @@ EMAIL_CONTEXT_CRITERIA = [
         detection_hint="Look for: 'first-time contact', 'we have worked together', 'reporting to them', 'they are a new hire', 'long-standing client', 'cold outreach'",
         weight=0.20,
     ),
-]
+)
 
-EMAIL_REFERENCES_CRITERIA = [
+EMAIL_REFERENCES_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="email_examples_provided",
         description="The prompt includes example emails, previous correspondence, or sample tone to emulate",
@@ -77,9 +83,9 @@ EMAIL_REFERENCES_CRITERIA = [
         detection_hint="Look for: 'they previously said...', 'in their last email...', 'we discussed...', 'the original thread was about...', forwarded content",
         weight=0.25,
     ),
-]
+)
 
-EMAIL_CONSTRAINTS_CRITERIA = [
+EMAIL_CONSTRAINTS_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="length_brevity",
         description="The prompt specifies email length constraints: brief, concise, one paragraph, under N sentences, or detailed",
@@ -104,11 +110,11 @@ EMAIL_CONSTRAINTS_CRITERIA = [
         detection_hint="Look for: 'ask them to...', 'request a meeting', 'they should reply with...', 'prompt them to approve', 'end with a question', 'include next steps'",
         weight=0.25,
     ),
-]
+)
 
-EMAIL_CRITERIA = {
+EMAIL_CRITERIA: Mapping[str, tuple[Criterion, ...]] = MappingProxyType({
     "task": EMAIL_TASK_CRITERIA,
     "context": EMAIL_CONTEXT_CRITERIA,
     "references": EMAIL_REFERENCES_CRITERIA,
     "constraints": EMAIL_CONSTRAINTS_CRITERIA,
-}
+})
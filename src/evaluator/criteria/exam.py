@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from src.evaluator.criteria.base import Criterion
 
-EXAM_TASK_CRITERIA = [
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+EXAM_TASK_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="assessment_objective_defined",
         description="The prompt clearly defines what the exam or interview should assess — knowledge, skills, competencies, or aptitude",
@@ -29,9 +35,9 @@ EXAM_TASK_CRITERIA = [
         detection_hint="Look for: 'include an answer key', 'scoring rubric', 'point values', 'grading criteria', 'model answers', 'expected responses', 'evaluation criteria', 'pass/fail threshold'",
         weight=0.20,
     ),
-]
+)
 
-EXAM_CONTEXT_CRITERIA = [
+EXAM_CONTEXT_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="candidate_profile_defined",
         description="The prompt describes the target candidate — their experience level, background, role being assessed, or expected knowledge base",
@@ -56,9 +62,9 @@ EXAM_CONTEXT_CRITERIA = [
         detection_hint="Look for: '60-minute exam', '5 minutes per question', 'time-boxed', 'timed assessment', 'allotted time', duration specifications, pacing guidance",
         weight=0.20,
     ),
-]
+)
 
-EXAM_REFERENCES_CRITERIA = [
+EXAM_REFERENCES_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="sample_questions_provided",
         description="The prompt includes sample questions, past exam examples, or question templates to follow",
@@ -77,9 +83,9 @@ EXAM_REFERENCES_CRITERIA = [
         detection_hint="Look for: 'Bloom's taxonomy', 'competency-based', 'ABET standards', 'Common Core aligned', 'ISO certification requirements', assessment frameworks, educational standards",
         weight=0.30,
     ),
-]
+)
 
-EXAM_CONSTRAINTS_CRITERIA = [
+EXAM_CONSTRAINTS_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="fairness_and_bias_safeguards",
         description="The prompt includes instructions to ensure questions are fair, unbiased, and accessible",
@@ -104,11 +110,11 @@ EXAM_CONSTRAINTS_CRITERIA = [
         detection_hint="Look for: 'do not include', 'avoid questions about', 'exclude memorization-only', 'no gotcha questions', 'skip advanced topics', 'don't test on', content boundaries",
         weight=0.25,
     ),
-]
+)
 
-EXAM_CRITERIA = {
+EXAM_CRITERIA: Mapping[str, tuple[Criterion, ...]] = MappingProxyType({
     "task": EXAM_TASK_CRITERIA,
     "context": EXAM_CONTEXT_CRITERIA,
     "references": EXAM_REFERENCES_CRITERIA,
     "constraints": EXAM_CONSTRAINTS_CRITERIA,
-}
+})
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from src.evaluator.criteria.base import Criterion
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 # ── Task Dimension ────────────────────────────────────
-TASK_CRITERIA = [
+TASK_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="clear_action_verb",
         description="The prompt contains a clear, imperative action verb that specifies what to do",
@@ -30,10 +36,10 @@ TASK_CRITERIA = [
         detection_hint="Look for: bullet list, numbered list, table, paragraph, JSON, markdown, email format, specific word/page count",
         weight=0.20,
     ),
-]
+)
 
 # ── Context Dimension ─────────────────────────────────
-CONTEXT_CRITERIA = [
+CONTEXT_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="background_provided",
         description="The prompt includes background information or situational context",
@@ -58,10 +64,10 @@ CONTEXT_CRITERIA = [
         detection_hint="Look for: industry terms, specific technologies, geographic scope, time periods, specialized vocabulary",
         weight=0.25,
     ),
-]
+)
 
 # ── References Dimension ──────────────────────────────
-REFERENCES_CRITERIA = [
+REFERENCES_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="examples_included",
         description="The prompt includes examples of expected output or input/output pairs",
@@ -80,10 +86,10 @@ REFERENCES_CRITERIA = [
         detection_hint="Look for: 'Refer to these materials', 'Use the following examples', 'Based on this', 'Reference the'",
         weight=0.30,
     ),
-]
+)
 
 # ── Constraints Dimension ─────────────────────────────
-CONSTRAINTS_CRITERIA = [
+CONSTRAINTS_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="scope_boundaries",
         description="The prompt defines clear boundaries on what to include or focus on",
@@ -108,11 +114,11 @@ CONSTRAINTS_CRITERIA = [
         detection_hint="Look for: 'do not include', 'avoid', 'exclude', 'should not', 'don't mention', 'leave out'",
         weight=0.25,
     ),
-]
+)
 
-ALL_CRITERIA = {
+ALL_CRITERIA: Mapping[str, tuple[Criterion, ...]] = MappingProxyType({
     "task": TASK_CRITERIA,
     "context": CONTEXT_CRITERIA,
     "references": REFERENCES_CRITERIA,
     "constraints": CONSTRAINTS_CRITERIA,
-}
+})
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from src.evaluator.criteria.base import Criterion
 
-LINKEDIN_TASK_CRITERIA = [
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+LINKEDIN_TASK_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="post_objective_defined",
         description="The prompt specifies the type of LinkedIn post to create: thought leadership, industry insight, personal story, how-to, announcement, or commentary",
@@ -29,9 +35,9 @@ LINKEDIN_TASK_CRITERIA = [
         detection_hint="Look for: 'ask a question at the end', 'encourage comments', 'invite sharing', 'link to', 'tag someone', 'call to action', 'engagement question', 'what do you think?', 'agree or disagree?'",
         weight=0.20,
     ),
-]
+)
 
-LINKEDIN_CONTEXT_CRITERIA = [
+LINKEDIN_CONTEXT_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="target_audience_specified",
         description="The prompt specifies who the post is targeting: industry, role, seniority level, or professional community",
@@ -56,9 +62,9 @@ LINKEDIN_CONTEXT_CRITERIA = [
         detection_hint="Look for: 'LinkedIn algorithm', 'hashtags', 'engagement', 'visibility', 'first 2 lines', 'hook', 'line breaks', 'emoji usage', 'posting time', 'dwell time', platform-specific formatting guidance",
         weight=0.20,
     ),
-]
+)
 
-LINKEDIN_REFERENCES_CRITERIA = [
+LINKEDIN_REFERENCES_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="inspiration_posts_provided",
         description="The prompt includes example posts, style references, or viral post templates to emulate",
@@ -77,9 +83,9 @@ LINKEDIN_REFERENCES_CRITERIA = [
         detection_hint="Look for: 'from my experience', 'I have seen', 'our team found', 'in my 15 years', 'based on our company data', 'lessons I learned', 'mistakes I made', personal anecdotes or proprietary insights",
         weight=0.30,
     ),
-]
+)
 
-LINKEDIN_CONSTRAINTS_CRITERIA = [
+LINKEDIN_CONSTRAINTS_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="length_formatting_constraints",
         description="The prompt specifies character or word limits, hook requirements for the first 2 lines, line break formatting, or paragraph length",
@@ -104,11 +110,11 @@ LINKEDIN_CONSTRAINTS_CRITERIA = [
         detection_hint="Look for: 'include 3-5 hashtags', 'niche hashtags', 'relevant hashtags', 'hashtag placement', '@mention', 'tag the company', 'branded hashtag', hashtag count or strategy",
         weight=0.25,
     ),
-]
+)
 
-LINKEDIN_CRITERIA = {
+LINKEDIN_CRITERIA: Mapping[str, tuple[Criterion, ...]] = MappingProxyType({
     "task": LINKEDIN_TASK_CRITERIA,
     "context": LINKEDIN_CONTEXT_CRITERIA,
     "references": LINKEDIN_REFERENCES_CRITERIA,
     "constraints": LINKEDIN_CONSTRAINTS_CRITERIA,
-}
+})
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from src.evaluator.criteria.base import Criterion
 
-SUMMARIZATION_TASK_CRITERIA = [
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+SUMMARIZATION_TASK_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="content_scope_specified",
         description="The prompt specifies WHICH content to summarize — a portion of a document, a specific sub-topic, or the entire source. Google best practice: 'Specify which content you want the gen AI tool to summarize, such as a portion of a document or a specific sub topic'",
@@ -29,9 +35,9 @@ SUMMARIZATION_TASK_CRITERIA = [
         detection_hint="Look for: 'as an analyst', 'act as a technical writer', 'as a researcher', 'you are an executive assistant', 'from the perspective of a...', 'at a 9th grade reading level', 'for a non-expert', 'for a specialist'",
         weight=0.20,
     ),
-]
+)
 
-SUMMARIZATION_CONTEXT_CRITERIA = [
+SUMMARIZATION_CONTEXT_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="source_document_described",
         description="The prompt describes the source document: its type, title, subject, length, or origin — giving the gen AI enough context to understand what it is processing",
@@ -56,9 +62,9 @@ SUMMARIZATION_CONTEXT_CRITERIA = [
         detection_hint="Look for: industry jargon, technical terms, legal terminology, medical vocabulary, financial concepts, academic discipline references, field-specific abbreviations",
         weight=0.20,
     ),
-]
+)
 
-SUMMARIZATION_REFERENCES_CRITERIA = [
+SUMMARIZATION_REFERENCES_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="source_material_provided",
         description="The prompt includes, attaches, or clearly references the source text that needs to be summarized. Without the source material, the gen AI cannot produce an accurate summary",
@@ -77,9 +83,9 @@ SUMMARIZATION_REFERENCES_CRITERIA = [
         detection_hint="Look for: 'focus on the methodology', 'prioritize the findings', 'emphasize the conclusions', 'skip the introduction', 'concentrate on chapters 3-5', section references, topic priorities",
         weight=0.25,
     ),
-]
+)
 
-SUMMARIZATION_CONSTRAINTS_CRITERIA = [
+SUMMARIZATION_CONSTRAINTS_CRITERIA: tuple[Criterion, ...] = (
     Criterion(
         name="length_word_limits",
         description="The prompt specifies hard length constraints for the summary output. Google iterate guidance: adjust the length if the summary isn't working for you",
@@ -104,11 +110,11 @@ SUMMARIZATION_CONSTRAINTS_CRITERIA = [
         detection_hint="Look for: 'exclude the appendix', 'skip the bibliography', 'omit technical details', 'leave out examples', 'do not include anecdotes', 'avoid jargon', 'no references section'",
         weight=0.25,
     ),
-]
+)
 
-SUMMARIZATION_CRITERIA = {
+SUMMARIZATION_CRITERIA: Mapping[str, tuple[Criterion, ...]] = MappingProxyType({
     "task": SUMMARIZATION_TASK_CRITERIA,
     "context": SUMMARIZATION_CONTEXT_CRITERIA,
     "references": SUMMARIZATION_REFERENCES_CRITERIA,
     "constraints": SUMMARIZATION_CONSTRAINTS_CRITERIA,
-}
+})
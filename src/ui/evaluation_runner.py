@@ -49,6 +49,9 @@ NODE_STEP_MAP: dict[str, tuple[str, str, int]] = {
     "build_report": ("Building Report", "Assembling final audit report with CoT, ToT, comparison sections", 7),
 }
 
+# Denominator for the progress percentage; the map is constant, so sum it once
+_TOTAL_STEP_WEIGHT = sum(w for _, _, w in NODE_STEP_MAP.values())
+
 
 async def _run_evaluation(user_input: str, mode: EvalMode) -> None:
     """Run the LangGraph full evaluation with real-time step progress."""
@@ -128,8 +131,7 @@ async def _run_evaluation(user_input: str, mode: EvalMode) -> None:
                 completed_weight += weight
 
                 # Calculate progress percentage based on weights
-                total_weight = sum(w for _, _, w in NODE_STEP_MAP.values())
-                progress_pct = min(int((completed_weight / total_weight) * 100), 100)
+                progress_pct = min(int((completed_weight / _TOTAL_STEP_WEIGHT) * 100), 100)
                 elapsed = now - start_time
 
                 step_output = _extract_step_summary(node_name, state_update)
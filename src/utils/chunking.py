@@ -8,22 +8,33 @@ score aggregation for per-chunk analysis results.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, replace
+from enum import IntEnum, auto
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+from src.evaluator import DIMENSION_NAMES, DimensionScore, SubCriterionResult, TCREIFlags
 
-class ChunkType(str, Enum):
-    """Semantic type of a prompt chunk."""
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-    TASK = "task"
-    CONTEXT = "context"
-    EXAMPLES = "examples"
-    CONSTRAINTS = "constraints"
-    INSTRUCTIONS = "instructions"
-    GENERAL = "general"
 
+class ChunkType(IntEnum):
+    """Semantic type of a prompt chunk.
 
-@dataclass
+    Int-valued so the tags on every section and chunk compare as small ints;
+    use ``.name`` where a readable label is needed.
+    """
+
+    TASK = auto()
+    CONTEXT = auto()
+    EXAMPLES = auto()
+    CONSTRAINTS = auto()
+    INSTRUCTIONS = auto()
+    GENERAL = auto()
+
+
+@dataclass(frozen=True, slots=True)
 class PromptChunk:
     """A single chunk of a segmented prompt."""
 
@@ -36,28 +47,47 @@ class PromptChunk:
 
 # ── Section detection patterns ───────────────────────
 
-_SECTION_PATTERNS: list[tuple[re.Pattern, ChunkType]] = [
-    # Markdown headers
-    (re.compile(r"^#{1,3}\s+.*task", re.IGNORECASE | re.MULTILINE), ChunkType.TASK),
-    (re.compile(r"^#{1,3}\s+.*context", re.IGNORECASE | re.MULTILINE), ChunkType.CONTEXT),
-    (re.compile(r"^#{1,3}\s+.*example", re.IGNORECASE | re.MULTILINE), ChunkType.EXAMPLES),
-    (re.compile(r"^#{1,3}\s+.*constraint", re.IGNORECASE | re.MULTILINE), ChunkType.CONSTRAINTS),
-    (re.compile(r"^#{1,3}\s+.*instruction", re.IGNORECASE | re.MULTILINE), ChunkType.INSTRUCTIONS),
-    (re.compile(r"^#{1,3}\s+.*requirement", re.IGNORECASE | re.MULTILINE), ChunkType.CONSTRAINTS),
-    (re.compile(r"^#{1,3}\s+.*reference", re.IGNORECASE | re.MULTILINE), ChunkType.EXAMPLES),
-    # Generic markdown header (catch-all)
-    (re.compile(r"^#{1,3}\s+\S", re.MULTILINE), ChunkType.GENERAL),
-    # XML-style tags
-    (re.compile(r"<task>", re.IGNORECASE), ChunkType.TASK),
-    (re.compile(r"<context>", re.IGNORECASE), ChunkType.CONTEXT),
-    (re.compile(r"<example", re.IGNORECASE), ChunkType.EXAMPLES),
-    (re.compile(r"<constraint", re.IGNORECASE), ChunkType.CONSTRAINTS),
-    (re.compile(r"<instruction", re.IGNORECASE), ChunkType.INSTRUCTIONS),
-    (re.compile(r"<reference", re.IGNORECASE), ChunkType.EXAMPLES),
-]
+# Keywords looked up in a header line, in priority order. A header that
+# matches none of them is still a section boundary of type GENERAL.
+_HEADER_KEYWORDS: tuple[tuple[str, ChunkType], ...] = (
+    ("task", ChunkType.TASK),
+    ("context", ChunkType.CONTEXT),
+    ("example", ChunkType.EXAMPLES),
+    ("constraint", ChunkType.CONSTRAINTS),
+    ("instruction", ChunkType.INSTRUCTIONS),
+    ("requirement", ChunkType.CONSTRAINTS),
+    ("reference", ChunkType.EXAMPLES),
+)
+
+# Markdown header prefix (``#`` to ``###`` plus spacing), matched at the start
+# of a line only. Header lines are found by a plain line scan so the regex
+# never runs over body text.
+_HEADER_PREFIX_RE = re.compile(r"#{1,3}[^\S\n]+")
+
+# XML-style opening tags; ``tag`` (case-folded) keys _XML_TAG_TYPES.
+_XML_TAG_RE = re.compile(
+    r"<(?P<tag>task>|context>|example|constraint|instruction|reference)",
+    re.IGNORECASE,
+)
+
+_XML_TAG_TYPES: dict[str, ChunkType] = {
+    "task>": ChunkType.TASK,
+    "context>": ChunkType.CONTEXT,
+    "example": ChunkType.EXAMPLES,
+    "constraint": ChunkType.CONSTRAINTS,
+    "instruction": ChunkType.INSTRUCTIONS,
+    "reference": ChunkType.EXAMPLES,
+}
+
+# Paragraph break (blank line, possibly containing whitespace), captured so
+# split() keeps the separators
+_PARAGRAPH_BREAK_RE = re.compile(r"(\n\s*\n)")
 
 _TOKEN_ESTIMATE_RATIO = 4  # ~4 chars per token
 
+# Position of each dimension in DIMENSION_NAMES, for list-indexed aggregation
+_DIM_INDEX: dict[str, int] = {name: i for i, name in enumerate(DIMENSION_NAMES)}
+
 
 def _estimate_tokens(text: str) -> int:
     """Rough token count estimate (4 chars per token)."""
@@ -71,7 +101,29 @@ def should_chunk(text: str, threshold: int = 2000) -> bool:
         text: The prompt text to evaluate.
         threshold: Token estimate threshold (default 2000).
     """
-    return _estimate_tokens(text) >= threshold
+    if not text:
+        return False
+    # For non-empty text, same cut-off as ``_estimate_tokens(text) >= threshold``
+    # (including its 1-token floor), compared in characters so the common
+    # short-prompt case is a single len() check.
+    return threshold <= 1 or len(text) >= threshold * _TOKEN_ESTIMATE_RATIO
+
+
+def _scan_md_headers(text: str) -> Iterator[tuple[int, ChunkType]]:
+    """Yield (char_offset, ChunkType) for each markdown header line in *text*.
+
+    A header is a line starting with one to three ``#`` followed by spacing
+    and non-empty text; its type comes from the first matching keyword.
+    """
+    offset = 0
+    for line in text.split("\n"):
+        if line.startswith("#"):
+            match = _HEADER_PREFIX_RE.match(line)
+            if match:
+                header = line[match.end():].casefold()
+                if header:
+                    yield offset, next((t for kw, t in _HEADER_KEYWORDS if kw in header), ChunkType.GENERAL)
+        offset += len(line) + 1
 
 
 def detect_sections(text: str) -> list[tuple[int, ChunkType]]:
@@ -79,17 +131,14 @@ def detect_sections(text: str) -> list[tuple[int, ChunkType]]:
 
     Returns a list of (char_offset, ChunkType) tuples, sorted by offset.
     """
-    sections: list[tuple[int, ChunkType]] = []
-    seen_offsets: set[int] = set()
-
-    for pattern, chunk_type in _SECTION_PATTERNS:
-        for match in pattern.finditer(text):
-            offset = match.start()
-            if offset not in seen_offsets:
-                sections.append((offset, chunk_type))
-                seen_offsets.add(offset)
-
-    sections.sort(key=lambda x: x[0])
+    sections = list(_scan_md_headers(text))
+    sections.extend(
+        (match.start(), _XML_TAG_TYPES[match.group("tag").casefold()])
+        for match in _XML_TAG_RE.finditer(text)
+    )
+    # Headers start with "#" and tags with "<", so offsets never collide;
+    # both runs are already ordered, which keeps this sort linear.
+    sections.sort(key=lambda section: section[0])
     return sections
 
 
@@ -105,9 +154,20 @@ def chunk_prompt(text: str) -> list[PromptChunk]:
         text: The full prompt text.
 
     Returns:
-        A list of PromptChunk objects.
+        A list of PromptChunk objects. Results are cached per stripped text,
+        so repeated calls return a fresh list over the same chunk objects.
     """
-    text = text.strip()
+    return list(_chunk_prompt_cached(text.strip()))
+
+
+@lru_cache(maxsize=128)
+def _chunk_prompt_cached(text: str) -> tuple[PromptChunk, ...]:
+    """Memoized :func:`_chunk_prompt_uncached` for already-stripped text."""
+    return tuple(_chunk_prompt_uncached(text))
+
+
+def _chunk_prompt_uncached(text: str) -> list[PromptChunk]:
+    """Chunk already-stripped text without consulting the cache."""
     if not text:
         return []
 
@@ -154,11 +214,13 @@ def _chunk_by_sections(text: str, sections: list[tuple[int, ChunkType]]) -> list
 
 def _chunk_by_paragraphs(text: str) -> list[PromptChunk]:
     """Split text on double-newline paragraph breaks."""
-    paragraphs = re.split(r"\n\s*\n", text)
+    # The capturing group keeps separators at odd indices, so offsets advance
+    # by each paragraph's real separator length rather than an assumed 2.
+    parts = _PARAGRAPH_BREAK_RE.split(text)
     chunks = []
     offset = 0
 
-    for para in paragraphs:
+    for para, sep in zip(parts[::2], [*parts[1::2], ""], strict=True):
         content = para.strip()
         if content:
             chunks.append(PromptChunk(
@@ -168,7 +230,7 @@ def _chunk_by_paragraphs(text: str) -> list[PromptChunk]:
                 char_offset=offset,
                 token_estimate=_estimate_tokens(content),
             ))
-        offset += len(para) + 2  # +2 for the \n\n separator
+        offset += len(para) + len(sep)
 
     return _merge_small_chunks(chunks)
 
@@ -196,13 +258,11 @@ def _merge_small_chunks(chunks: list[PromptChunk], min_tokens: int = 50) -> list
             ))
             i += 2
         else:
-            merged.append(PromptChunk(
-                content=current.content,
-                chunk_type=current.chunk_type,
-                index=len(merged),
-                char_offset=current.char_offset,
-                token_estimate=current.token_estimate,
-            ))
+            # Chunks are frozen, so an unchanged one can be kept as is; only
+            # chunks after a merge need their index shifted down.
+            if current.index != len(merged):
+                current = replace(current, index=len(merged))
+            merged.append(current)
             i += 1
 
     return merged
@@ -223,56 +283,55 @@ def aggregate_dimension_scores(
     Returns:
         A single aggregated analysis result dict.
     """
+    # Single chunk is the common case: return it untouched before any setup
+    if len(chunk_scores) == 1:
+        return chunk_scores[0]
+
     if not chunk_scores:
         from src.agent.nodes.analyzer import _empty_analysis
         return _empty_analysis()
 
-    if len(chunk_scores) == 1:
-        return chunk_scores[0]
-
     total_tokens = sum(chunk_tokens)
     if total_tokens == 0:
         total_tokens = len(chunk_tokens)  # avoid division by zero
 
-    # Weighted average for dimension scores
-    dim_names = ["task", "context", "references", "constraints"]
-    aggregated_dimensions = []
-
-    for dim_name in dim_names:
-        weighted_score = 0.0
-        all_sub_criteria = {}
-
-        for i, result in enumerate(chunk_scores):
-            weight = chunk_tokens[i] / total_tokens
-            dims = result.get("dimensions", [])
-            dim = next((d for d in dims if d.name == dim_name), None)
-            if dim is None:
+    # Weighted average for dimension scores, accumulated in one pass over chunks
+    # into lists indexed by dimension position
+    weighted_scores = [0.0] * len(DIMENSION_NAMES)
+    all_sub_criteria: list[dict[str, SubCriterionResult]] = [{} for _ in DIMENSION_NAMES]
+
+    for result, tokens in zip(chunk_scores, chunk_tokens, strict=True):
+        weight = tokens / total_tokens
+        seen = 0  # bitmask of dimensions taken from this chunk; first entry wins
+        for dim in result.get("dimensions", []):
+            idx = _DIM_INDEX.get(dim.name)
+            if idx is None or seen >> idx & 1:
                 continue
+            seen |= 1 << idx
 
-            weighted_score += dim.score * weight
+            weighted_scores[idx] += dim.score * weight
 
             # Deduplicate sub-criteria by name, keeping the most detailed
+            best = all_sub_criteria[idx]
             for sc in dim.sub_criteria:
-                if sc.name not in all_sub_criteria or len(sc.detail) > len(all_sub_criteria[sc.name].detail):
-                    all_sub_criteria[sc.name] = sc
+                cur = best.get(sc.name)
+                if cur is None or len(sc.detail) > len(cur.detail):
+                    best[sc.name] = sc
 
-        from src.evaluator import DimensionScore
-        aggregated_dimensions.append(DimensionScore(
+    aggregated_dimensions = [
+        DimensionScore(
             name=dim_name,
-            score=round(weighted_score),
-            sub_criteria=list(all_sub_criteria.values()),
-        ))
+            score=round(weighted_scores[idx]),
+            sub_criteria=list(all_sub_criteria[idx].values()),
+        )
+        for idx, dim_name in enumerate(DIMENSION_NAMES)
+    ]
 
     # OR-merge for flags (if any chunk detects a flag, it's present)
-    from src.evaluator import TCREIFlags
-    merged_flags = TCREIFlags()
+    merged_mask = 0
     for result in chunk_scores:
         flags = result.get("tcrei_flags")
         if flags:
-            merged_flags.task = merged_flags.task or flags.task
-            merged_flags.context = merged_flags.context or flags.context
-            merged_flags.references = merged_flags.references or flags.references
-            merged_flags.evaluate = merged_flags.evaluate or flags.evaluate
-            merged_flags.iterate = merged_flags.iterate or flags.iterate
+            merged_mask |= flags.to_mask()
 
-    return {"dimensions": aggregated_dimensions, "tcrei_flags": merged_flags}
+    return {"dimensions": aggregated_dimensions, "tcrei_flags": TCREIFlags.from_mask(merged_mask)}
@@ -668,6 +668,13 @@ def _build_comparison_section_html(
     )
 
 
+# Engine weights for the composite improvement score
+_STRUCTURAL_WEIGHT = 0.25
+_OUTPUT_WEIGHT = 0.35
+_META_WEIGHT = 0.20
+_TOT_WEIGHT = 0.20
+
+
 def _compute_composite_improvement(
     struct_score: int,
     output_score: int,
@@ -696,15 +703,18 @@ def _compute_composite_improvement(
     """
     structural_signal = (100 - struct_score) / 100
     raw_delta = opt_output_score - output_score
-    output_signal = max(0, raw_delta) / 100
+    # (d + |d|) / 2 clamps negative deltas to 0 without a comparison
+    output_signal = (raw_delta + abs(raw_delta)) / 200
     meta_signal = meta_confidence if meta_confidence is not None else 0.5
     tot_signal = tot_branch_confidence if tot_branch_confidence is not None else 0.5
 
+    # Plain left-to-right multiply-add: sum()/fsum()/sumprod() round differently
+    # (and sum() differs between 3.11 and 3.12), which would move .5 ties.
     composite_raw = (
-        structural_signal * 0.25
-        + output_signal * 0.35
-        + meta_signal * 0.20
-        + tot_signal * 0.20
+        structural_signal * _STRUCTURAL_WEIGHT
+        + output_signal * _OUTPUT_WEIGHT
+        + meta_signal * _META_WEIGHT
+        + tot_signal * _TOT_WEIGHT
     )
     composite_pct = round(composite_raw * 100)
 
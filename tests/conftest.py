@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from src.config.eval_config import EvalConfig, load_eval_config
@@ -20,6 +24,9 @@ from src.evaluator import (
     TCREIFlags,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
 
 @pytest.fixture
 def eval_config() -> EvalConfig:
@@ -141,3 +148,81 @@ def sample_full_report(
         ],
         rewritten_prompt="You're a veterinarian...",
     )
+
+
+@pytest.fixture(scope="module")
+def _analyzer_llm_patches() -> Iterator[SimpleNamespace]:
+    """Patch the analyzer's LLM and retrieval dependencies once per module.
+
+    The patches stay applied until module teardown, so only request this
+    (via ``analyzer_llm``) from modules whose tests all stub the analyzer.
+    """
+    mocks = SimpleNamespace(
+        get_llm=MagicMock(return_value=MagicMock()),
+        invoke=AsyncMock(),
+        rag=AsyncMock(),
+        similar=AsyncMock(),
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.agent.nodes.analyzer.get_llm", mocks.get_llm)
+        mp.setattr("src.agent.nodes.analyzer.invoke_structured", mocks.invoke)
+        mp.setattr("src.agent.nodes.analyzer.retrieve_context", mocks.rag)
+        mp.setattr("src.agent.nodes.analyzer._retrieve_similar_evaluations", mocks.similar)
+        yield mocks
+
+
+@pytest.fixture
+def analyzer_llm(_analyzer_llm_patches: SimpleNamespace) -> SimpleNamespace:
+    """Analyzer mocks, reset to defaults for each test.
+
+    ``invoke`` stands in for ``invoke_structured`` (set ``return_value`` per
+    test); ``rag`` returns no context and ``similar`` no past evaluations.
+    """
+    mocks = _analyzer_llm_patches
+    mocks.get_llm.reset_mock()
+    mocks.invoke.reset_mock(return_value=True, side_effect=True)
+    mocks.rag.reset_mock(side_effect=True)
+    mocks.rag.return_value = ""
+    mocks.similar.reset_mock(side_effect=True)
+    mocks.similar.return_value = []
+    return mocks
+
+
+@pytest.fixture
+def stub_invoke(analyzer_llm: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> Callable[[object], None]:
+    """Replace ``invoke_structured`` with a plain coroutine returning a fixed value.
+
+    For analyzer tests that never inspect the call; unlike ``analyzer_llm.invoke``
+    it records nothing. The patch is undone after the test.
+    """
+
+    def install(value: object) -> None:
+        async def _invoke(*_args: object, **_kwargs: object) -> object:
+            return value
+
+        monkeypatch.setattr("src.agent.nodes.analyzer.invoke_structured", _invoke)
+
+    return install
+
+
+@pytest.fixture
+def fake_settings(monkeypatch: pytest.MonkeyPatch) -> Callable[..., SimpleNamespace]:
+    """Installer for a plain document-settings object in place of ``get_settings``.
+
+    Call it with the dotted module paths to patch; it returns the shared
+    settings namespace so a test can override individual values.
+    """
+    settings = SimpleNamespace(
+        doc_max_file_size=100 * 1024 * 1024,
+        doc_chunk_size=1000,
+        doc_chunk_overlap=200,
+        doc_enable_extraction=False,
+        doc_max_chunks_per_query=15,
+    )
+
+    def install(*modules: str) -> SimpleNamespace:
+        for module in modules:
+            monkeypatch.setattr(f"{module}.get_settings", lambda: settings)
+        return settings
+
+    return install
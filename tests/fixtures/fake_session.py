@@ -0,0 +1,29 @@
+"""Lightweight async database session stub for unit tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class FakeSession:
+    """Minimal stand-in for ``AsyncSession`` without mock call machinery.
+
+    ``execute`` returns the preset results in order (raising any exception
+    instance in the sequence); ``add`` records objects in ``added``.
+    """
+
+    def __init__(self, execute_results: list[Any] | tuple[Any, ...] = ()) -> None:
+        self._results = list(execute_results)
+        self.added: list[Any] = []
+
+    async def execute(self, *_args: Any, **_kwargs: Any) -> Any:
+        result = self._results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def add(self, obj: Any) -> None:
+        self.added.append(obj)
+
+    async def flush(self) -> None:
+        pass
@@ -0,0 +1,12 @@
+"""Minimal binary image payloads shared by attachment tests."""
+
+# Minimal 1x1 PNG
+PNG_1X1 = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
+    b"\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00"
+    b"\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00"
+    b"\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+# Minimal JPEG header (SOI + APP0 marker)
+JPEG_HEADER = b"\xff\xd8\xff\xe0"
@@ -1,9 +1,5 @@
 """Unit tests for the analyzer node."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
-
-import pytest
-
 from src.agent.nodes.analyzer import (
     _build_criteria_description,
     _empty_analysis,
@@ -12,6 +8,7 @@ from src.agent.nodes.analyzer import (
     analyze_prompt,
     analyze_system_prompt,
 )
+from src.evaluator import SubCriterionResult
 from src.evaluator.llm_schemas import (
     AnalysisLLMResponse,
     DimensionLLMResponse,
@@ -98,6 +95,23 @@ class TestEmptyAnalysis:
         for dim in result["dimensions"]:
             assert dim.sub_criteria == []
 
+    def test_each_call_returns_fresh_containers(self):
+        first, second = _empty_analysis(), _empty_analysis()
+        assert first["dimensions"] is not second["dimensions"]
+        assert first["tcrei_flags"] is not second["tcrei_flags"]
+        for a, b in zip(first["dimensions"], second["dimensions"], strict=True):
+            assert a is not b
+            assert a.sub_criteria is not b.sub_criteria
+
+    def test_mutating_result_does_not_leak_into_later_calls(self):
+        first = _empty_analysis()
+        first["dimensions"][0].score = 99
+        first["dimensions"][0].sub_criteria.append(SubCriterionResult(name="role", found=True, detail="x"))
+
+        second = _empty_analysis()
+        assert second["dimensions"][0].score == 0
+        assert second["dimensions"][0].sub_criteria == []
+
     def test_tcrei_flags_all_false(self):
         result = _empty_analysis()
         flags = result["tcrei_flags"]
@@ -132,6 +146,9 @@ class TestBuildCriteriaDescription:
         desc = _build_criteria_description()
         assert "hint:" in desc
 
+    def test_cached_per_task_type(self):
+        assert _build_criteria_description("email_writing") is _build_criteria_description("email_writing")
+
     def test_email_task_type_includes_email_criteria(self):
         desc = _build_criteria_description("email_writing")
         assert "email_action_specified" in desc
@@ -203,8 +220,7 @@ class TestFormatHistoricalContext:
 
 
 class TestAnalyzePrompt:
-    @pytest.mark.asyncio
-    async def test_analyze_prompt_returns_dimensions(self):
+    async def test_analyze_prompt_returns_dimensions(self, stub_invoke):
         mock_response = AnalysisLLMResponse(
             dimensions={
                 "task": DimensionLLMResponse(score=70, sub_criteria=[]),
@@ -215,38 +231,26 @@ class TestAnalyzePrompt:
             tcrei_flags=TCREIFlagsLLMResponse(task=True),
         )
 
-        with patch("src.agent.nodes.analyzer.get_llm") as mock_llm, \
-             patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
-             patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value=""), \
-             patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[]):
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
-
-            state = {"input_text": "Write me something about dogs", "mode": "prompt", "user_id": None}
-            result = await analyze_prompt(state)
-
-            assert "dimension_scores" in result
-            assert len(result["dimension_scores"]) == 4
-            assert result["current_step"] == "analysis_complete"
-
-    @pytest.mark.asyncio
-    async def test_analyze_prompt_fallback_on_none(self):
-        with patch("src.agent.nodes.analyzer.get_llm") as mock_llm, \
-             patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
-             patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value=""), \
-             patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[]):
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = None
-
-            state = {"input_text": "bad prompt", "mode": "prompt", "user_id": None}
-            result = await analyze_prompt(state)
-
-            assert len(result["dimension_scores"]) == 4
-            for dim in result["dimension_scores"]:
-                assert dim.score == 0
-
-    @pytest.mark.asyncio
-    async def test_analyze_prompt_with_similar_evaluations(self):
+        stub_invoke(mock_response)
+
+        state = {"input_text": "Write me something about dogs", "mode": "prompt", "user_id": None}
+        result = await analyze_prompt(state)
+
+        assert "dimension_scores" in result
+        assert len(result["dimension_scores"]) == 4
+        assert result["current_step"] == "analysis_complete"
+
+    async def test_analyze_prompt_fallback_on_none(self, stub_invoke):
+        stub_invoke(None)
+
+        state = {"input_text": "bad prompt", "mode": "prompt", "user_id": None}
+        result = await analyze_prompt(state)
+
+        assert len(result["dimension_scores"]) == 4
+        for dim in result["dimension_scores"]:
+            assert dim.score == 0
+
+    async def test_analyze_prompt_with_similar_evaluations(self, analyzer_llm, stub_invoke):
         mock_response = AnalysisLLMResponse(
             dimensions={
                 "task": DimensionLLMResponse(score=70, sub_criteria=[]),
@@ -268,21 +272,16 @@ class TestAnalyzePrompt:
             },
         ]
 
-        with patch("src.agent.nodes.analyzer.get_llm") as mock_llm, \
-             patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
-             patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value=""), \
-             patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=similar):
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
+        analyzer_llm.similar.return_value = similar
+        stub_invoke(mock_response)
 
-            state = {"input_text": "Write me something about dogs", "mode": "prompt", "user_id": None}
-            result = await analyze_prompt(state)
+        state = {"input_text": "Write me something about dogs", "mode": "prompt", "user_id": None}
+        result = await analyze_prompt(state)
 
-            assert result["similar_evaluations"] == similar
-            assert "dimension_scores" in result
+        assert result["similar_evaluations"] == similar
+        assert "dimension_scores" in result
 
-    @pytest.mark.asyncio
-    async def test_analyze_prompt_email_task_type_uses_email_prompt(self):
+    async def test_analyze_prompt_email_task_type_uses_email_prompt(self, analyzer_llm):
         from src.evaluator import TaskType
 
         mock_response = AnalysisLLMResponse(
@@ -295,29 +294,23 @@ class TestAnalyzePrompt:
             tcrei_flags=TCREIFlagsLLMResponse(task=True),
         )
 
-        with patch("src.agent.nodes.analyzer.get_llm") as mock_llm, \
-             patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
-             patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value=""), \
-             patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[]):
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
-
-            state = {
-                "input_text": "Write an email to my manager asking for PTO",
-                "mode": "prompt",
-                "user_id": None,
-                "task_type": TaskType.EMAIL_WRITING,
-            }
-            result = await analyze_prompt(state)
+        analyzer_llm.invoke.return_value = mock_response
 
-            assert "dimension_scores" in result
-            # Verify the email analysis prompt was used via the system message
-            call_prompt = mock_invoke.call_args[0][1]
-            system_msg = call_prompt.messages[0]
-            assert "email" in system_msg.content.lower()
+        state = {
+            "input_text": "Write an email to my manager asking for PTO",
+            "mode": "prompt",
+            "user_id": None,
+            "task_type": TaskType.EMAIL_WRITING,
+        }
+        result = await analyze_prompt(state)
 
-    @pytest.mark.asyncio
-    async def test_analyze_prompt_general_task_type_uses_default_prompt(self):
+        assert "dimension_scores" in result
+        # Verify the email analysis prompt was used via the system message
+        call_prompt = analyzer_llm.invoke.call_args[0][1]
+        system_msg = call_prompt.messages[0]
+        assert "email" in system_msg.content.lower()
+
+    async def test_analyze_prompt_general_task_type_uses_default_prompt(self, analyzer_llm):
         from src.evaluator import TaskType
 
         mock_response = AnalysisLLMResponse(
@@ -330,29 +323,23 @@ class TestAnalyzePrompt:
             tcrei_flags=TCREIFlagsLLMResponse(task=True),
         )
 
-        with patch("src.agent.nodes.analyzer.get_llm") as mock_llm, \
-             patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
-             patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value=""), \
-             patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[]):
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
-
-            state = {
-                "input_text": "Write a blog post about dogs",
-                "mode": "prompt",
-                "user_id": None,
-                "task_type": TaskType.GENERAL,
-            }
-            result = await analyze_prompt(state)
+        analyzer_llm.invoke.return_value = mock_response
 
-            assert "dimension_scores" in result
-            # Verify the default ANALYSIS_SYSTEM_PROMPT was used (not email)
-            call_prompt = mock_invoke.call_args[0][1]
-            system_msg = call_prompt.messages[0]
-            assert "email communication coach" not in system_msg.content
+        state = {
+            "input_text": "Write a blog post about dogs",
+            "mode": "prompt",
+            "user_id": None,
+            "task_type": TaskType.GENERAL,
+        }
+        result = await analyze_prompt(state)
 
-    @pytest.mark.asyncio
-    async def test_analyze_prompt_summarization_task_type_uses_summarization_prompt(self):
+        assert "dimension_scores" in result
+        # Verify the default ANALYSIS_SYSTEM_PROMPT was used (not email)
+        call_prompt = analyzer_llm.invoke.call_args[0][1]
+        system_msg = call_prompt.messages[0]
+        assert "email communication coach" not in system_msg.content
+
+    async def test_analyze_prompt_summarization_task_type_uses_summarization_prompt(self, analyzer_llm):
         from src.evaluator import TaskType
 
         mock_response = AnalysisLLMResponse(
@@ -365,29 +352,23 @@ class TestAnalyzePrompt:
             tcrei_flags=TCREIFlagsLLMResponse(task=True),
         )
 
-        with patch("src.agent.nodes.analyzer.get_llm") as mock_llm, \
-             patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
-             patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value=""), \
-             patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[]):
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
-
-            state = {
-                "input_text": "Summarize this research paper into key takeaways",
-                "mode": "prompt",
-                "user_id": None,
-                "task_type": TaskType.SUMMARIZATION,
-            }
-            result = await analyze_prompt(state)
+        analyzer_llm.invoke.return_value = mock_response
+
+        state = {
+            "input_text": "Summarize this research paper into key takeaways",
+            "mode": "prompt",
+            "user_id": None,
+            "task_type": TaskType.SUMMARIZATION,
+        }
+        result = await analyze_prompt(state)
 
-            assert "dimension_scores" in result
-            # Verify the summarization analysis prompt was used via the system message
-            call_prompt = mock_invoke.call_args[0][1]
-            system_msg = call_prompt.messages[0]
-            assert "summarization" in system_msg.content.lower()
+        assert "dimension_scores" in result
+        # Verify the summarization analysis prompt was used via the system message
+        call_prompt = analyzer_llm.invoke.call_args[0][1]
+        system_msg = call_prompt.messages[0]
+        assert "summarization" in system_msg.content.lower()
 
-    @pytest.mark.asyncio
-    async def test_analyze_system_prompt_returns_dimensions(self):
+    async def test_analyze_system_prompt_returns_dimensions(self, stub_invoke):
         mock_response = AnalysisLLMResponse(
             dimensions={
                 "task": DimensionLLMResponse(score=85, sub_criteria=[]),
@@ -398,19 +379,15 @@ class TestAnalyzePrompt:
             tcrei_flags=TCREIFlagsLLMResponse(task=True, context=True, references=True, evaluate=True),
         )
 
-        with patch("src.agent.nodes.analyzer.get_llm") as mock_llm, \
-             patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
-             patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value=""):
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
+        stub_invoke(mock_response)
 
-            state = {
-                "input_text": "You are a medical assistant",
-                "mode": "system_prompt",
-                "expected_outcome": "Structured SOAP notes",
-            }
-            result = await analyze_system_prompt(state)
+        state = {
+            "input_text": "You are a medical assistant",
+            "mode": "system_prompt",
+            "expected_outcome": "Structured SOAP notes",
+        }
+        result = await analyze_system_prompt(state)
 
-            assert "dimension_scores" in result
-            assert result["tcrei_flags"].task is True
-            assert result["current_step"] == "analysis_complete"
+        assert "dimension_scores" in result
+        assert result["tcrei_flags"].task is True
+        assert result["current_step"] == "analysis_complete"
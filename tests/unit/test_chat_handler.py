@@ -2,60 +2,86 @@
 
 from __future__ import annotations
 
-import tempfile
+import os
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
+import pytest
+
 from src.app import _extract_chunk_deltas, _extract_thinking_and_text, _process_attachments
+from tests.fixtures.images import JPEG_HEADER, PNG_1X1
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 # ---------------------------------------------------------------------------
 # _extract_thinking_and_text tests
 # ---------------------------------------------------------------------------
 
 
-class TestExtractThinkingAndText:
-    """Tests for the thinking/text extraction helper."""
+@dataclass
+class _Block:
+    """Typed content block (Anthropic style) with ``type`` and ``text``."""
 
-    def test_string_content(self) -> None:
-        thinking, text = _extract_thinking_and_text("Hello world")
-        assert thinking == ""
-        assert text == "Hello world"
+    type: str
+    text: str
 
-    def test_empty_string(self) -> None:
-        thinking, text = _extract_thinking_and_text("")
-        assert thinking == ""
-        assert text == ""
 
-    def test_dict_blocks_with_thinking(self) -> None:
-        content = [
-            {"type": "thinking", "text": "Let me think about this..."},
-            {"type": "text", "text": "Here is my answer."},
-        ]
-        thinking, text = _extract_thinking_and_text(content)
-        assert thinking == "Let me think about this..."
-        assert text == "Here is my answer."
+@dataclass
+class _ThinkingBlock:
+    """Typed streaming thinking block carrying a ``thinking`` delta."""
 
-    def test_dict_blocks_no_thinking(self) -> None:
-        content = [
-            {"type": "text", "text": "Direct answer."},
-        ]
-        thinking, text = _extract_thinking_and_text(content)
-        assert thinking == ""
-        assert text == "Direct answer."
+    type: str
+    thinking: str
+    text: str = ""
 
-    def test_typed_objects_with_thinking(self) -> None:
-        @dataclass
-        class Block:
-            type: str
-            text: str
 
-        content = [
-            Block(type="thinking", text="Reasoning here"),
-            Block(type="text", text="Final response"),
-        ]
+class TestExtractThinkingAndText:
+    """Tests for the thinking/text extraction helper."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected_thinking", "expected_text"),
+        [
+            ("Hello world", "", "Hello world"),
+            ("", "", ""),
+            (
+                [
+                    {"type": "thinking", "text": "Let me think about this..."},
+                    {"type": "text", "text": "Here is my answer."},
+                ],
+                "Let me think about this...",
+                "Here is my answer.",
+            ),
+            ([{"type": "text", "text": "Direct answer."}], "", "Direct answer."),
+            (
+                [_Block(type="thinking", text="Reasoning here"), _Block(type="text", text="Final response")],
+                "Reasoning here",
+                "Final response",
+            ),
+            (42, "", "42"),
+            ([], "", ""),
+            (
+                [{"type": "thinking", "text": "Dict thinking"}, _Block(type="text", text="Object text")],
+                "Dict thinking",
+                "Object text",
+            ),
+        ],
+        ids=[
+            "string_content",
+            "empty_string",
+            "dict_blocks_with_thinking",
+            "dict_blocks_no_thinking",
+            "typed_objects_with_thinking",
+            "non_list_non_string",
+            "empty_list",
+            "mixed_dict_and_typed_blocks",
+        ],
+    )
+    def test_extract(self, content: object, expected_thinking: str, expected_text: str) -> None:
         thinking, text = _extract_thinking_and_text(content)
-        assert thinking == "Reasoning here"
-        assert text == "Final response"
+        assert thinking == expected_thinking
+        assert text == expected_text
 
     def test_multiple_thinking_blocks(self) -> None:
         content = [
@@ -64,34 +90,9 @@ class TestExtractThinkingAndText:
             {"type": "text", "text": "Answer"},
         ]
         thinking, text = _extract_thinking_and_text(content)
-        assert "Step 1" in thinking
-        assert "Step 2" in thinking
+        assert {"Step 1", "Step 2"} <= set(thinking.split("\n"))
         assert text == "Answer"
 
-    def test_non_list_non_string(self) -> None:
-        thinking, text = _extract_thinking_and_text(42)
-        assert thinking == ""
-        assert text == "42"
-
-    def test_empty_list(self) -> None:
-        thinking, text = _extract_thinking_and_text([])
-        assert thinking == ""
-        assert text == ""
-
-    def test_mixed_dict_and_typed_blocks(self) -> None:
-        @dataclass
-        class Block:
-            type: str
-            text: str
-
-        content = [
-            {"type": "thinking", "text": "Dict thinking"},
-            Block(type="text", text="Object text"),
-        ]
-        thinking, text = _extract_thinking_and_text(content)
-        assert thinking == "Dict thinking"
-        assert text == "Object text"
-
 
 # ---------------------------------------------------------------------------
 # _extract_chunk_deltas tests
@@ -101,71 +102,37 @@ class TestExtractThinkingAndText:
 class TestExtractChunkDeltas:
     """Tests for the streaming chunk delta extractor."""
 
-    def test_string_content(self) -> None:
-        thinking, text = _extract_chunk_deltas("Hello")
-        assert thinking == ""
-        assert text == "Hello"
-
-    def test_empty_string(self) -> None:
-        thinking, text = _extract_chunk_deltas("")
-        assert thinking == ""
-        assert text == ""
-
-    def test_none_content(self) -> None:
-        thinking, text = _extract_chunk_deltas(None)
-        assert thinking == ""
-        assert text == ""
-
-    def test_dict_thinking_block(self) -> None:
-        content = [{"type": "thinking", "thinking": "Let me reason..."}]
+    @pytest.mark.parametrize(
+        ("content", "expected_thinking", "expected_text"),
+        [
+            ("Hello", "", "Hello"),
+            ("", "", ""),
+            (None, "", ""),
+            ([{"type": "thinking", "thinking": "Let me reason..."}], "Let me reason...", ""),
+            ([{"type": "thinking", "text": "Fallback thinking"}], "Fallback thinking", ""),
+            ([{"type": "text", "text": "Response text"}], "", "Response text"),
+            ([_ThinkingBlock(type="thinking", thinking="Deep thought")], "Deep thought", ""),
+            ([_Block(type="text", text="Streamed text")], "", "Streamed text"),
+            ([], "", ""),
+            (42, "", "42"),
+        ],
+        ids=[
+            "string_content",
+            "empty_string",
+            "none_content",
+            "dict_thinking_block",
+            "dict_thinking_block_fallback_to_text_key",
+            "dict_text_block",
+            "typed_object_with_thinking_attr",
+            "typed_object_text_block",
+            "empty_list",
+            "non_list_non_string",
+        ],
+    )
+    def test_extract(self, content: object, expected_thinking: str, expected_text: str) -> None:
         thinking, text = _extract_chunk_deltas(content)
-        assert thinking == "Let me reason..."
-        assert text == ""
-
-    def test_dict_thinking_block_fallback_to_text_key(self) -> None:
-        content = [{"type": "thinking", "text": "Fallback thinking"}]
-        thinking, text = _extract_chunk_deltas(content)
-        assert thinking == "Fallback thinking"
-        assert text == ""
-
-    def test_dict_text_block(self) -> None:
-        content = [{"type": "text", "text": "Response text"}]
-        thinking, text = _extract_chunk_deltas(content)
-        assert thinking == ""
-        assert text == "Response text"
-
-    def test_typed_object_with_thinking_attr(self) -> None:
-        @dataclass
-        class ThinkingBlock:
-            type: str
-            thinking: str
-            text: str = ""
-
-        content = [ThinkingBlock(type="thinking", thinking="Deep thought")]
-        thinking, text = _extract_chunk_deltas(content)
-        assert thinking == "Deep thought"
-        assert text == ""
-
-    def test_typed_object_text_block(self) -> None:
-        @dataclass
-        class TextBlock:
-            type: str
-            text: str
-
-        content = [TextBlock(type="text", text="Streamed text")]
-        thinking, text = _extract_chunk_deltas(content)
-        assert thinking == ""
-        assert text == "Streamed text"
-
-    def test_empty_list(self) -> None:
-        thinking, text = _extract_chunk_deltas([])
-        assert thinking == ""
-        assert text == ""
-
-    def test_non_list_non_string(self) -> None:
-        thinking, text = _extract_chunk_deltas(42)
-        assert thinking == ""
-        assert text == "42"
+        assert thinking == expected_thinking
+        assert text == expected_text
 
 
 # ---------------------------------------------------------------------------
@@ -173,59 +140,46 @@ class TestExtractChunkDeltas:
 # ---------------------------------------------------------------------------
 
 
+def _attach(tmp_path: Path, name: str, data: bytes) -> MagicMock:
+    """Write ``data`` to ``tmp_path / name`` and return a matching chat element."""
+    file_path = tmp_path / name
+    file_path.write_bytes(data)
+    elem = MagicMock(spec=["name", "path"], path=str(file_path))
+    elem.name = name
+    return elem
+
+
 class TestProcessAttachments:
     """Tests for the file attachment processor."""
 
-    def test_text_file_reads_content(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".py", mode="w", delete=False) as f:
-            f.write("print('hello')")
-            f.flush()
-            elem = MagicMock(name="script.py", path=f.name)
-            elem.name = "script.py"
+    def test_text_file_reads_content(self, tmp_path: Path) -> None:
+        elem = _attach(tmp_path, "script.py", b"print('hello')")
 
         text_prefix, image_blocks, _ = _process_attachments([elem])
         assert "print('hello')" in text_prefix
         assert "```py" in text_prefix
         assert image_blocks == []
 
-    def test_oversized_file_skipped(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".txt", mode="w", delete=False) as f:
-            # Write more than 100KB
-            f.write("x" * (101 * 1024))
-            f.flush()
-            elem = MagicMock(name="big.txt", path=f.name)
-            elem.name = "big.txt"
+    def test_oversized_file_skipped(self, tmp_path: Path) -> None:
+        elem = _attach(tmp_path, "big.txt", b"")
+        # Sparse file just over 100KB — only its size is checked, never its content
+        os.truncate(elem.path, 101 * 1024)
 
         text_prefix, image_blocks, _ = _process_attachments([elem])
         assert "Skipped" in text_prefix
         assert "100KB" in text_prefix
         assert image_blocks == []
 
-    def test_unsupported_extension_skipped(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".zip", mode="wb", delete=False) as f:
-            f.write(b"PK\x03\x04")
-            f.flush()
-            elem = MagicMock(name="archive.zip", path=f.name)
-            elem.name = "archive.zip"
+    def test_unsupported_extension_skipped(self, tmp_path: Path) -> None:
+        elem = _attach(tmp_path, "archive.zip", b"PK\x03\x04")
 
         text_prefix, image_blocks, _ = _process_attachments([elem])
         assert "Skipped" in text_prefix
         assert "unsupported" in text_prefix
         assert image_blocks == []
 
-    def test_image_file_returns_base64_block(self) -> None:
-        # Create a minimal 1x1 PNG
-        png_bytes = (
-            b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
-            b"\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00"
-            b"\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00"
-            b"\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82"
-        )
-        with tempfile.NamedTemporaryFile(suffix=".png", mode="wb", delete=False) as f:
-            f.write(png_bytes)
-            f.flush()
-            elem = MagicMock(name="photo.png", path=f.name)
-            elem.name = "photo.png"
+    def test_image_file_returns_base64_block(self, tmp_path: Path) -> None:
+        elem = _attach(tmp_path, "photo.png", PNG_1X1)
 
         text_prefix, image_blocks, _ = _process_attachments([elem])
         assert text_prefix == ""
@@ -234,7 +188,7 @@ class TestProcessAttachments:
         assert "data:image/png;base64," in image_blocks[0]["image_url"]["url"]
 
     def test_missing_path_skipped(self) -> None:
-        elem = MagicMock(name="file.txt", path=None)
+        elem = MagicMock(spec=["name", "path"], path=None)
         elem.name = "file.txt"
 
         text_prefix, image_blocks, _ = _process_attachments([elem])
@@ -246,12 +200,8 @@ class TestProcessAttachments:
         assert text_prefix == ""
         assert image_blocks == []
 
-    def test_jpeg_extension_uses_correct_media_type(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".jpg", mode="wb", delete=False) as f:
-            f.write(b"\xff\xd8\xff\xe0")  # minimal JPEG header
-            f.flush()
-            elem = MagicMock(name="photo.jpg", path=f.name)
-            elem.name = "photo.jpg"
+    def test_jpeg_extension_uses_correct_media_type(self, tmp_path: Path) -> None:
+        elem = _attach(tmp_path, "photo.jpg", JPEG_HEADER)
 
         _, image_blocks, _ = _process_attachments([elem])
         assert len(image_blocks) == 1
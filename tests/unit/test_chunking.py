@@ -1,9 +1,14 @@
 """Unit tests for adaptive chunking utilities."""
 
+import dataclasses
+
+import pytest
+
 from src.evaluator import DimensionScore, SubCriterionResult, TCREIFlags
 from src.utils.chunking import (
     ChunkType,
     PromptChunk,
+    _chunk_prompt_cached,
     aggregate_dimension_scores,
     chunk_prompt,
     detect_sections,
@@ -32,6 +37,14 @@ class TestShouldChunk:
     def test_empty_text(self):
         assert should_chunk("") is False
 
+    def test_empty_text_with_minimal_threshold(self):
+        assert should_chunk("", threshold=1) is False
+
+    def test_short_text_meets_minimal_threshold(self):
+        # The token estimate never drops below 1, so any non-empty text qualifies
+        assert should_chunk("abc", threshold=1) is True
+        assert should_chunk("a", threshold=0) is True
+
     def test_custom_threshold(self):
         text = "x" * 100  # 25 tokens
         assert should_chunk(text, threshold=20) is True
@@ -83,6 +96,18 @@ class TestDetectSections:
         types = [s[1] for s in sections]
         assert ChunkType.EXAMPLES in types
 
+    def test_header_and_tag_offsets_interleave(self):
+        text = "<context>bg</context>\n# Task\nDo it\n<example>x</example>"
+        assert detect_sections(text) == [
+            (0, ChunkType.CONTEXT),
+            (22, ChunkType.TASK),
+            (35, ChunkType.EXAMPLES),
+        ]
+
+    def test_bare_hash_line_does_not_take_next_line_as_header(self):
+        text = "#\nTask details follow\n## Context\nInfo"
+        assert detect_sections(text) == [(22, ChunkType.CONTEXT)]
+
 
 class TestChunkPrompt:
     def test_empty_text_returns_empty(self):
@@ -116,6 +141,14 @@ class TestChunkPrompt:
         # Paragraphs will be created but may be merged if too small
         assert len(chunks) >= 1
 
+    def test_paragraph_offsets_follow_real_separators(self):
+        para = "This paragraph is long enough to stay on its own. " * 6
+        text = f"{para}\n \n\n{para}\n\n{para}"
+        chunks = chunk_prompt(text)
+        assert len(chunks) == 3
+        for chunk in chunks:
+            assert text[chunk.char_offset:].startswith(chunk.content)
+
     def test_xml_sections_create_chunks(self):
         text = (
             "<task>Write a blog post about dogs</task>\n\n"
@@ -135,6 +168,11 @@ class TestChunkPrompt:
         assert chunk.index == 0
         assert chunk.token_estimate > 0
 
+    def test_chunks_are_immutable(self):
+        chunk = chunk_prompt("# Task\nDo something important and specific here")[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            chunk.content = "changed"  # type: ignore[misc]
+
     def test_long_text_with_headers(self):
         sections = []
         for i in range(5):
@@ -144,6 +182,23 @@ class TestChunkPrompt:
         chunks = chunk_prompt(text)
         assert len(chunks) >= 3  # Some sections may merge
 
+    def test_indices_contiguous_after_merging(self):
+        body = "Detailed content for this section. " * 20
+        text = f"# Task\nShort.\n\n## Context\n{body}\n\n## Notes\n{body}\n\n## Examples\n{body}"
+        chunks = chunk_prompt(text)
+        assert len(chunks) == 3  # the short Task section merges into Context
+        assert [c.index for c in chunks] == [0, 1, 2]
+        assert chunks[0].content.startswith("# Task")
+
+    def test_repeated_calls_hit_cache_and_return_fresh_lists(self):
+        text = "# Task\nSummarise the report.\n\n## Context\nFor the board meeting."
+        first = chunk_prompt(text)
+        hits = _chunk_prompt_cached.cache_info().hits
+        second = chunk_prompt(f"  {text}\n")
+        assert _chunk_prompt_cached.cache_info().hits == hits + 1
+        assert second == first
+        assert second is not first
+
 
 class TestAggregationDimensionScores:
     def test_single_chunk(self):
@@ -273,6 +328,40 @@ class TestAggregationDimensionScores:
         assert len(verb_scs) == 1
         assert "action verb" in verb_scs[0].detail  # the longer detail
 
+    def test_sub_criteria_deduplication_tie_keeps_first(self):
+        def chunk(detail: str) -> dict:
+            return {
+                "dimensions": [
+                    DimensionScore(
+                        name="task",
+                        score=50,
+                        sub_criteria=[SubCriterionResult(name="verb", found=True, detail=detail)],
+                    ),
+                ],
+                "tcrei_flags": TCREIFlags(),
+            }
+
+        result = aggregate_dimension_scores([chunk("first"), chunk("later")], [100, 100])
+        task_dim = next(d for d in result["dimensions"] if d.name == "task")
+        assert [sc.detail for sc in task_dim.sub_criteria] == ["first"]
+
+    def test_repeated_and_unknown_dimensions(self):
+        chunk = {
+            "dimensions": [
+                DimensionScore(name="context", score=80, sub_criteria=[]),
+                DimensionScore(name="context", score=10, sub_criteria=[]),
+                DimensionScore(name="evaluate", score=90, sub_criteria=[]),
+            ],
+            "tcrei_flags": TCREIFlags(),
+        }
+        result = aggregate_dimension_scores([chunk, chunk], [100, 100])
+        assert [(d.name, d.score) for d in result["dimensions"]] == [
+            ("task", 0),
+            ("context", 80),
+            ("references", 0),
+            ("constraints", 0),
+        ]
+
     def test_empty_input_returns_empty_analysis(self):
         result = aggregate_dimension_scores([], [])
         assert len(result["dimensions"]) == 4
@@ -140,3 +140,15 @@ class TestComputeCompositeImprovement:
         # 0.40*0.25 + 0.15*0.35 + 0.50*0.20 + 0.50*0.20
         # = 0.10 + 0.0525 + 0.10 + 0.10 = 0.3525 -> 35
         assert result["composite_pct"] == 35
+
+    def test_half_point_rounding_is_stable(self) -> None:
+        """Exact .5 composites keep the float rounding of the plain weighted sum."""
+        result = _compute_composite_improvement(
+            struct_score=58,
+            output_score=50,
+            opt_output_score=50,
+            meta_confidence=None,
+            tot_branch_confidence=None,
+        )
+        # 0.42*0.25 + 0 + 0.10 + 0.10 = 0.305 in exact arithmetic
+        assert result["composite_pct"] == 31
@@ -63,19 +63,22 @@ class TestBuildImprovementsSummary:
         assert result == "No improvements suggested."
 
 
+# Read-only message histories, built once per module
+_MSGS_MIXED = (
+    HumanMessage(content="Hello"),
+    AIMessage(content="Hi there"),
+    HumanMessage(content="Explain the context score"),
+)
+_MSGS_AI_ONLY = (AIMessage(content="Hi"),)
+
+
 class TestGetLatestUserMessage:
     def test_finds_human_message(self):
-        state = {
-            "messages": [
-                HumanMessage(content="Hello"),
-                AIMessage(content="Hi there"),
-                HumanMessage(content="Explain the context score"),
-            ],
-        }
+        state = {"messages": list(_MSGS_MIXED)}
         assert _get_latest_user_message(state) == "Explain the context score"
 
     def test_no_human_messages(self):
-        state = {"messages": [AIMessage(content="Hi")]}
+        state = {"messages": list(_MSGS_AI_ONLY)}
         assert _get_latest_user_message(state) == ""
 
     def test_empty_messages(self):
@@ -106,130 +109,95 @@ class TestMapFollowupResponse:
         assert result["response"] == ""
 
 
-class TestBuildStateUpdate:
-    def test_explain_intent(self):
-        result = {"intent": "explain", "response": "Details here", "new_prompt": None, "new_rewrite": None, "new_mode": None}
-        state = {}
-        update = _build_state_update(result, state)
-        assert update["followup_action"] == "explain"
-        assert update["current_step"] == "followup"
-        assert len(update["messages"]) == 1
-        assert "rewritten_prompt" not in update
-        assert "input_text" not in update
+_MISSING = object()
 
-    def test_adjust_rewrite_intent(self):
-        result = {"intent": "adjust_rewrite", "response": "Adjusted", "new_prompt": None, "new_rewrite": "New rewrite", "new_mode": None}
-        state = {}
-        update = _build_state_update(result, state)
-        assert update["followup_action"] == "adjust_rewrite"
-        assert update["rewritten_prompt"] == "New rewrite"
 
-    def test_adjust_rewrite_without_new_rewrite(self):
-        result = {"intent": "adjust_rewrite", "response": "No changes needed", "new_prompt": None, "new_rewrite": None, "new_mode": None}
-        state = {}
-        update = _build_state_update(result, state)
-        assert "rewritten_prompt" not in update
+class TestBuildStateUpdate:
+    @pytest.mark.parametrize(
+        ("intent", "fields", "expected"),
+        [
+            (
+                "explain",
+                {},
+                {"followup_action": "explain", "current_step": "followup",
+                 "rewritten_prompt": _MISSING, "input_text": _MISSING},
+            ),
+            ("adjust_rewrite", {"new_rewrite": "New rewrite"},
+             {"followup_action": "adjust_rewrite", "rewritten_prompt": "New rewrite"}),
+            ("adjust_rewrite", {}, {"rewritten_prompt": _MISSING}),
+            ("re_evaluate", {"new_prompt": "Updated prompt"},
+             {"followup_action": "re_evaluate", "input_text": "Updated prompt"}),
+            ("mode_switch", {"new_mode": "system_prompt"},
+             {"followup_action": "mode_switch", "mode": EvalMode.SYSTEM_PROMPT}),
+            ("mode_switch", {"new_mode": "prompt"}, {"mode": EvalMode.PROMPT}),
+            ("mode_switch", {}, {"mode": _MISSING}),
+        ],
+        ids=[
+            "explain", "adjust_rewrite", "adjust_rewrite_without_new_rewrite", "re_evaluate",
+            "mode_switch_to_system_prompt", "mode_switch_to_prompt", "mode_switch_without_new_mode",
+        ],
+    )
+    def test_build_state_update(self, intent, fields, expected):
+        result = {"intent": intent, "response": "Reply", "new_prompt": None, "new_rewrite": None, "new_mode": None}
+        update = _build_state_update({**result, **fields}, {})
+        assert len(update["messages"]) == 1
+        for key, value in expected.items():
+            if value is _MISSING:
+                assert key not in update
+            else:
+                assert update[key] == value
 
-    def test_re_evaluate_intent(self):
-        result = {"intent": "re_evaluate", "response": "Re-evaluating", "new_prompt": "Updated prompt", "new_rewrite": None, "new_mode": None}
-        state = {}
-        update = _build_state_update(result, state)
-        assert update["followup_action"] == "re_evaluate"
-        assert update["input_text"] == "Updated prompt"
 
-    def test_mode_switch_to_system_prompt(self):
-        result = {"intent": "mode_switch", "response": "Switching", "new_prompt": None, "new_rewrite": None, "new_mode": "system_prompt"}
-        state = {}
-        update = _build_state_update(result, state)
-        assert update["followup_action"] == "mode_switch"
-        assert update["mode"] == EvalMode.SYSTEM_PROMPT
+def _followup_state(user_message: str, dimension_scores: list | None = None) -> dict:
+    return {
+        "input_text": "Write about dogs",
+        "overall_score": 25,
+        "grade": "Weak",
+        "dimension_scores": dimension_scores or [],
+        "improvements": [],
+        "rewritten_prompt": None,
+        "messages": [HumanMessage(content=user_message)],
+    }
 
-    def test_mode_switch_to_prompt(self):
-        result = {"intent": "mode_switch", "response": "Switching", "new_prompt": None, "new_rewrite": None, "new_mode": "prompt"}
-        state = {}
-        update = _build_state_update(result, state)
-        assert update["mode"] == EvalMode.PROMPT
 
-    def test_mode_switch_without_new_mode(self):
-        result = {"intent": "mode_switch", "response": "Cannot switch", "new_prompt": None, "new_rewrite": None, "new_mode": None}
-        state = {}
-        update = _build_state_update(result, state)
-        assert "mode" not in update
+@pytest.fixture
+def followup_invoke():
+    """Patch the follow-up node's LLM factory; yields the ``invoke_structured`` mock."""
+    with patch("src.agent.nodes.conversational.get_llm", return_value=MagicMock()), \
+         patch("src.agent.nodes.conversational.invoke_structured", new_callable=AsyncMock) as mock_invoke:
+        yield mock_invoke
 
 
 class TestHandleFollowup:
-    @pytest.mark.asyncio
-    async def test_handle_followup_explain(self):
-        mock_response = FollowupLLMResponse(
-            intent="explain",
-            response="The task score reflects...",
-        )
-
-        with patch("src.agent.nodes.conversational.get_llm") as mock_llm, \
-             patch("src.agent.nodes.conversational.invoke_structured", new_callable=AsyncMock) as mock_invoke:
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
-
-            state = {
-                "input_text": "Write about dogs",
-                "overall_score": 25,
-                "grade": "Weak",
-                "dimension_scores": [
-                    DimensionScore(name="task", score=30, sub_criteria=[]),
-                ],
-                "improvements": [],
-                "rewritten_prompt": None,
-                "messages": [HumanMessage(content="Explain the task score")],
-            }
-            result = await handle_followup(state)
-
-            assert result["followup_action"] == "explain"
-            assert result["current_step"] == "followup"
-
-    @pytest.mark.asyncio
-    async def test_handle_followup_re_evaluate(self):
-        mock_response = FollowupLLMResponse(
+    @pytest.mark.parametrize(
+        ("user_message", "response", "dimension_scores"),
+        [
+            pytest.param(
+                "Explain the task score",
+                FollowupLLMResponse(intent="explain", response="The task score reflects..."),
+                [DimensionScore(name="task", score=30, sub_criteria=[])],
+                id="explain",
+            ),
+            # All parsing attempts failed — falls back to an explanation
+            pytest.param("Tell me more", None, None, id="fallback_on_none"),
+        ],
+    )
+    async def test_handle_followup_explains(self, followup_invoke, user_message, response, dimension_scores):
+        followup_invoke.return_value = response
+
+        result = await handle_followup(_followup_state(user_message, dimension_scores))
+
+        assert result["followup_action"] == "explain"
+        assert result["current_step"] == "followup"
+
+    async def test_handle_followup_re_evaluate(self, followup_invoke):
+        followup_invoke.return_value = FollowupLLMResponse(
             intent="re_evaluate",
             response="Re-evaluating now",
             new_prompt="New prompt to evaluate",
         )
 
-        with patch("src.agent.nodes.conversational.get_llm") as mock_llm, \
-             patch("src.agent.nodes.conversational.invoke_structured", new_callable=AsyncMock) as mock_invoke:
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = mock_response
-
-            state = {
-                "input_text": "Write about dogs",
-                "overall_score": 25,
-                "grade": "Weak",
-                "dimension_scores": [],
-                "improvements": [],
-                "rewritten_prompt": None,
-                "messages": [HumanMessage(content="Re-evaluate: You are a vet...")],
-            }
-            result = await handle_followup(state)
-
-            assert result["followup_action"] == "re_evaluate"
-            assert result["input_text"] == "New prompt to evaluate"
-
-    @pytest.mark.asyncio
-    async def test_handle_followup_fallback_on_none(self):
-        with patch("src.agent.nodes.conversational.get_llm") as mock_llm, \
-             patch("src.agent.nodes.conversational.invoke_structured", new_callable=AsyncMock) as mock_invoke:
-            mock_llm.return_value = MagicMock()
-            mock_invoke.return_value = None
-
-            state = {
-                "input_text": "Write about dogs",
-                "overall_score": 25,
-                "grade": "Weak",
-                "dimension_scores": [],
-                "improvements": [],
-                "rewritten_prompt": None,
-                "messages": [HumanMessage(content="Tell me more")],
-            }
-            result = await handle_followup(state)
-
-            assert result["followup_action"] == "explain"
-            assert result["current_step"] == "followup"
+        result = await handle_followup(_followup_state("Re-evaluate: You are a vet..."))
+
+        assert result["followup_action"] == "re_evaluate"
+        assert result["input_text"] == "New prompt to evaluate"
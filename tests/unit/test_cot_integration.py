@@ -1,7 +1,5 @@
 """Unit tests for Chain-of-Thought integration in the analyzer node."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
-
 import pytest
 
 from src.agent.nodes.analyzer import _analyze_single, analyze_prompt
@@ -15,8 +13,9 @@ from src.evaluator.llm_schemas import (
 from src.evaluator.strategies import StrategyConfig
 
 
-def _make_analysis_response() -> AnalysisLLMResponse:
-    """Create a minimal valid analysis response for mocking."""
+@pytest.fixture(scope="module")
+def analysis_response() -> AnalysisLLMResponse:
+    """A minimal valid analysis response, built once and only read through the mock."""
     return AnalysisLLMResponse(
         dimensions={
             "task": DimensionLLMResponse(score=50, sub_criteria=[
@@ -30,14 +29,16 @@ def _make_analysis_response() -> AnalysisLLMResponse:
     )
 
 
+def _system_content(call_args) -> str:
+    """Render the system message of the prompt template passed to ``invoke_structured``."""
+    prompt_template = call_args[0][1]  # second positional arg is the prompt
+    return prompt_template.format_messages(input_text="Test")[0].content
+
+
 class TestCoTInAnalyzeSingle:
-    @pytest.mark.asyncio
-    @patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock)
-    @patch("src.agent.nodes.analyzer.get_llm")
-    async def test_cot_preamble_always_prepended(self, mock_get_llm, mock_invoke):
+    async def test_cot_preamble_always_prepended(self, analyzer_llm, analysis_response):
         """CoT preamble is always prepended since CoT is always active."""
-        mock_invoke.return_value = _make_analysis_response()
-        mock_get_llm.return_value = MagicMock()
+        analyzer_llm.invoke.return_value = analysis_response
 
         original_prompt = "You are an evaluator. {criteria} {rag_context}"
         await _analyze_single(
@@ -48,21 +49,13 @@ class TestCoTInAnalyzeSingle:
         )
 
         # The prompt template should have been called with CoT preamble prepended
-        call_args = mock_invoke.call_args
-        prompt_template = call_args[0][1]  # second positional arg is the prompt
-        # Extract system message content from the ChatPromptTemplate
-        messages = prompt_template.format_messages(input_text="Test prompt")
-        system_content = messages[0].content
+        system_content = _system_content(analyzer_llm.invoke.call_args)
         assert "STEP 1" in system_content
         assert "Chain-of-Thought" in system_content
 
-    @pytest.mark.asyncio
-    @patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock)
-    @patch("src.agent.nodes.analyzer.get_llm")
-    async def test_output_format_unchanged_with_cot(self, mock_get_llm, mock_invoke):
+    async def test_output_format_unchanged_with_cot(self, stub_invoke, analysis_response):
         """CoT changes reasoning, not output schema."""
-        mock_invoke.return_value = _make_analysis_response()
-        mock_get_llm.return_value = MagicMock()
+        stub_invoke(analysis_response)
 
         original_prompt = "You are an evaluator. {criteria} {rag_context}"
         result = await _analyze_single(
@@ -77,88 +70,37 @@ class TestCoTInAnalyzeSingle:
         assert len(result["dimensions"]) == 4
 
 
-class TestCoTInAnalyzePrompt:
-    @pytest.mark.asyncio
-    @patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[])
-    @patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value="")
-    @patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock)
-    @patch("src.agent.nodes.analyzer.get_llm")
-    async def test_cot_always_applied_with_strategy(
-        self, mock_get_llm, mock_invoke, mock_rag, mock_similar
-    ):
-        mock_invoke.return_value = _make_analysis_response()
-        mock_get_llm.return_value = MagicMock()
-
-        state = {
-            "input_text": "Write a blog post",
-            "mode": EvalMode.PROMPT,
-            "task_type": TaskType.GENERAL,
-            "llm_provider": "google",
-            "user_id": "test",
-            "strategy": StrategyConfig(use_cot=True),
-        }
+@pytest.fixture(scope="class")
+def base_analyze_state() -> dict:
+    """Analyze-prompt state with a CoT strategy; tests copy it rather than mutate it."""
+    return {
+        "input_text": "Write a blog post",
+        "mode": EvalMode.PROMPT,
+        "task_type": TaskType.GENERAL,
+        "llm_provider": "google",
+        "user_id": "test",
+        "strategy": StrategyConfig(use_cot=True),
+    }
 
-        result = await analyze_prompt(state)
-        assert result["dimension_scores"] is not None
 
-        # Verify the prompt included CoT preamble
-        call_args = mock_invoke.call_args
-        prompt_template = call_args[0][1]
-        messages = prompt_template.format_messages(input_text="Test")
-        system_content = messages[0].content
-        assert "STEP 1" in system_content
-
-    @pytest.mark.asyncio
-    @patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[])
-    @patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value="")
-    @patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock)
-    @patch("src.agent.nodes.analyzer.get_llm")
-    async def test_cot_always_applied_without_strategy(
-        self, mock_get_llm, mock_invoke, mock_rag, mock_similar
-    ):
-        """CoT is always applied even when no strategy is provided."""
-        mock_invoke.return_value = _make_analysis_response()
-        mock_get_llm.return_value = MagicMock()
-
-        state = {
-            "input_text": "Write a blog post",
-            "mode": EvalMode.PROMPT,
-            "task_type": TaskType.GENERAL,
-            "llm_provider": "google",
-            "user_id": "test",
-        }
+class TestCoTInAnalyzePrompt:
+    @pytest.mark.parametrize("with_strategy", [True, False], ids=["with_strategy", "without_strategy"])
+    async def test_cot_always_applied(self, analyzer_llm, analysis_response, base_analyze_state, with_strategy):
+        """CoT preamble is present whether or not a strategy is provided."""
+        analyzer_llm.invoke.return_value = analysis_response
+        state = {k: v for k, v in base_analyze_state.items() if with_strategy or k != "strategy"}
 
         result = await analyze_prompt(state)
         assert result["dimension_scores"] is not None
 
-        call_args = mock_invoke.call_args
-        prompt_template = call_args[0][1]
-        messages = prompt_template.format_messages(input_text="Test")
-        system_content = messages[0].content
-        # CoT is always on, so preamble should be present
+        system_content = _system_content(analyzer_llm.invoke.call_args)
+        assert "STEP 1" in system_content
         assert "Chain-of-Thought" in system_content
 
-    @pytest.mark.asyncio
-    @patch("src.agent.nodes.analyzer._retrieve_similar_evaluations", new_callable=AsyncMock, return_value=[])
-    @patch("src.agent.nodes.analyzer.retrieve_context", new_callable=AsyncMock, return_value="")
-    @patch("src.agent.nodes.analyzer.invoke_structured", new_callable=AsyncMock)
-    @patch("src.agent.nodes.analyzer.get_llm")
-    async def test_cot_reasoning_trace_returned(
-        self, mock_get_llm, mock_invoke, mock_rag, mock_similar
-    ):
+    async def test_cot_reasoning_trace_returned(self, stub_invoke, analysis_response, base_analyze_state):
         """analyze_prompt returns a cot_reasoning_trace in its state update."""
-        mock_invoke.return_value = _make_analysis_response()
-        mock_get_llm.return_value = MagicMock()
-
-        state = {
-            "input_text": "Write a blog post",
-            "mode": EvalMode.PROMPT,
-            "task_type": TaskType.GENERAL,
-            "llm_provider": "google",
-            "user_id": "test",
-            "strategy": StrategyConfig(use_cot=True),
-        }
+        stub_invoke(analysis_response)
 
-        result = await analyze_prompt(state)
+        result = await analyze_prompt({**base_analyze_state})
         assert "cot_reasoning_trace" in result
         assert result["cot_reasoning_trace"] is not None
@@ -10,6 +10,8 @@ from src.evaluator.criteria import (
     get_criteria_for_task_type,
 )
 
+_REG_KEYS = tuple(_CRITERIA_REGISTRY)
+
 
 class TestCriteriaRegistryCompleteness:
     """Verify all non-general TaskType values have criteria entries."""
@@ -30,23 +32,15 @@ class TestGetCriteriaForTaskType:
         result = get_criteria_for_task_type("unknown_type")
         assert result is ALL_CRITERIA
 
-    @pytest.mark.parametrize("key", list(_CRITERIA_REGISTRY.keys()))
-    def test_known_type_returns_specific_criteria(self, key: str):
-        result = get_criteria_for_task_type(key)
-        assert result is _CRITERIA_REGISTRY[key]
-
-    @pytest.mark.parametrize("key", list(_CRITERIA_REGISTRY.keys()))
-    def test_criteria_dict_has_four_dimensions(self, key: str):
+    @pytest.mark.parametrize("key", _REG_KEYS)
+    def test_registry_entry_shape(self, key: str):
+        """Dispatcher returns the registered dict: four dimensions of Criterion tuples."""
         criteria = _CRITERIA_REGISTRY[key]
+        assert get_criteria_for_task_type(key) is criteria
         assert len(criteria) == 4, f"{key} has {len(criteria)} dimensions, expected 4"
-
-    @pytest.mark.parametrize("key", list(_CRITERIA_REGISTRY.keys()))
-    def test_criteria_values_are_criterion_lists(self, key: str):
-        criteria = _CRITERIA_REGISTRY[key]
         for dim_name, crit_list in criteria.items():
-            assert isinstance(crit_list, list), f"{key}.{dim_name} is not a list"
-            for c in crit_list:
-                assert isinstance(c, Criterion), f"{key}.{dim_name} contains non-Criterion"
+            assert isinstance(crit_list, tuple), f"{key}.{dim_name} is not a tuple"
+            assert all(isinstance(c, Criterion) for c in crit_list), f"{key}.{dim_name} contains non-Criterion"
 
     def test_all_criteria_has_four_dimensions(self):
         assert len(ALL_CRITERIA) == 4
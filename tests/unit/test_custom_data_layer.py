@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from chainlit.data.chainlit_data_layer import ChainlitDataLayer
 
 from src.utils.custom_data_layer import CustomDataLayer
 
@@ -19,15 +20,18 @@ def data_layer():
         return layer
 
 
+@pytest.fixture
+def parent_delete_thread(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Stub ChainlitDataLayer.delete_thread so only the app-table cleanup runs."""
+    mock_super = AsyncMock()
+    monkeypatch.setattr(ChainlitDataLayer, "delete_thread", mock_super)
+    return mock_super
+
+
 class TestCustomDataLayerDeleteThread:
-    @pytest.mark.asyncio
-    async def test_delete_thread_cleans_app_tables(self, data_layer):
+    async def test_delete_thread_cleans_app_tables(self, data_layer, parent_delete_thread):
         """Verify DELETE queries are issued for both app tables."""
-        with patch(
-            "chainlit.data.chainlit_data_layer.ChainlitDataLayer.delete_thread",
-            new_callable=AsyncMock,
-        ) as mock_super:
-            await data_layer.delete_thread("thread-abc-123")
+        await data_layer.delete_thread("thread-abc-123")
 
         # Should have 2 app-table DELETEs + whatever super does
         calls = data_layer.execute_query.call_args_list
@@ -35,29 +39,19 @@ class TestCustomDataLayerDeleteThread:
 
         assert any("conversation_embeddings" in q for q in queries)
         assert any("evaluations" in q for q in queries)
-        mock_super.assert_awaited_once_with("thread-abc-123")
+        parent_delete_thread.assert_awaited_once_with("thread-abc-123")
 
-    @pytest.mark.asyncio
-    async def test_delete_thread_proceeds_on_cleanup_failure(self, data_layer):
+    async def test_delete_thread_proceeds_on_cleanup_failure(self, data_layer, parent_delete_thread):
         """Exception in app cleanup doesn't block parent delete_thread."""
         data_layer.execute_query = AsyncMock(side_effect=Exception("DB error"))
 
-        with patch(
-            "chainlit.data.chainlit_data_layer.ChainlitDataLayer.delete_thread",
-            new_callable=AsyncMock,
-        ) as mock_super:
-            await data_layer.delete_thread("thread-xyz")
+        await data_layer.delete_thread("thread-xyz")
 
         # Parent delete should still be called
-        mock_super.assert_awaited_once_with("thread-xyz")
+        parent_delete_thread.assert_awaited_once_with("thread-xyz")
 
-    @pytest.mark.asyncio
-    async def test_delete_thread_calls_super(self, data_layer):
+    async def test_delete_thread_calls_super(self, data_layer, parent_delete_thread):
         """Parent delete_thread is always called."""
-        with patch(
-            "chainlit.data.chainlit_data_layer.ChainlitDataLayer.delete_thread",
-            new_callable=AsyncMock,
-        ) as mock_super:
-            await data_layer.delete_thread("thread-123")
+        await data_layer.delete_thread("thread-123")
 
-        mock_super.assert_awaited_once_with("thread-123")
+        parent_delete_thread.assert_awaited_once_with("thread-123")
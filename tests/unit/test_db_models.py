@@ -2,8 +2,38 @@
 
 import uuid
 
+import pytest
+
 from src.db.models import Base, ConversationEmbedding, EvalConfig, Evaluation
 
+_ZERO_EMBEDDING = (0.0,) * 1536
+
+
+@pytest.fixture(scope="class")
+def minimal_evaluation() -> Evaluation:
+    """One Evaluation with only required fields, shared read-only within a class."""
+    return Evaluation(
+        id=uuid.uuid4(),
+        session_id="test-session",
+        mode="prompt",
+        input_text="Test prompt",
+        overall_score=75,
+        grade="Good",
+        analysis={},
+        improvements=[],
+    )
+
+
+@pytest.fixture(scope="class")
+def minimal_embedding() -> ConversationEmbedding:
+    """One ConversationEmbedding with only required fields, shared read-only within a class."""
+    return ConversationEmbedding(
+        input_text="Test prompt",
+        overall_score=65,
+        grade="Good",
+        embedding=_ZERO_EMBEDDING,
+    )
+
 
 class TestEvaluationModel:
     def test_table_name(self):
@@ -25,34 +55,14 @@ class TestEvaluationModel:
         pk_cols = [c.name for c in Evaluation.__table__.primary_key.columns]
         assert pk_cols == ["id"]
 
-    def test_instantiation(self):
-        eval_obj = Evaluation(
-            id=uuid.uuid4(),
-            session_id="test-session",
-            mode="prompt",
-            input_text="Test prompt",
-            overall_score=75,
-            grade="Good",
-            analysis={},
-            improvements=[],
-        )
-        assert eval_obj.mode == "prompt"
-        assert eval_obj.overall_score == 75
+    def test_instantiation(self, minimal_evaluation):
+        assert minimal_evaluation.mode == "prompt"
+        assert minimal_evaluation.overall_score == 75
 
-    def test_nullable_fields(self):
-        eval_obj = Evaluation(
-            id=uuid.uuid4(),
-            session_id="s",
-            mode="prompt",
-            input_text="t",
-            overall_score=0,
-            grade="Weak",
-            analysis={},
-            improvements=[],
-        )
-        assert eval_obj.expected_outcome is None
-        assert eval_obj.rewritten_prompt is None
-        assert eval_obj.config_snapshot is None
+    def test_nullable_fields(self, minimal_evaluation):
+        assert minimal_evaluation.expected_outcome is None
+        assert minimal_evaluation.rewritten_prompt is None
+        assert minimal_evaluation.config_snapshot is None
 
     def test_new_output_columns_exist(self):
         column_names = {c.name for c in Evaluation.__table__.columns}
@@ -61,21 +71,11 @@ class TestEvaluationModel:
         assert "output_evaluation" in column_names
         assert "langsmith_run_id" in column_names
 
-    def test_new_output_columns_nullable(self):
-        eval_obj = Evaluation(
-            id=uuid.uuid4(),
-            session_id="s",
-            mode="prompt",
-            input_text="t",
-            overall_score=0,
-            grade="Weak",
-            analysis={},
-            improvements=[],
-        )
-        assert eval_obj.eval_phase is None
-        assert eval_obj.llm_output is None
-        assert eval_obj.output_evaluation is None
-        assert eval_obj.langsmith_run_id is None
+    def test_new_output_columns_nullable(self, minimal_evaluation):
+        assert minimal_evaluation.eval_phase is None
+        assert minimal_evaluation.llm_output is None
+        assert minimal_evaluation.output_evaluation is None
+        assert minimal_evaluation.langsmith_run_id is None
 
 
 class TestEvalConfigModel:
@@ -117,29 +117,17 @@ class TestConversationEmbeddingModel:
         pk_cols = [c.name for c in ConversationEmbedding.__table__.primary_key.columns]
         assert pk_cols == ["id"]
 
-    def test_instantiation(self):
-        obj = ConversationEmbedding(
-            input_text="Test prompt",
-            overall_score=65,
-            grade="Good",
-            embedding=[0.1] * 1536,
-        )
-        assert obj.input_text == "Test prompt"
-        assert obj.overall_score == 65
-        assert obj.grade == "Good"
-
-    def test_nullable_fields(self):
-        obj = ConversationEmbedding(
-            input_text="test",
-            overall_score=0,
-            grade="Weak",
-            embedding=[0.0] * 1536,
-        )
-        assert obj.user_id is None
-        assert obj.evaluation_id is None
-        assert obj.rewritten_prompt is None
-        assert obj.output_score is None
-        assert obj.improvements_summary is None
+    def test_instantiation(self, minimal_embedding):
+        assert minimal_embedding.input_text == "Test prompt"
+        assert minimal_embedding.overall_score == 65
+        assert minimal_embedding.grade == "Good"
+
+    def test_nullable_fields(self, minimal_embedding):
+        assert minimal_embedding.user_id is None
+        assert minimal_embedding.evaluation_id is None
+        assert minimal_embedding.rewritten_prompt is None
+        assert minimal_embedding.output_score is None
+        assert minimal_embedding.improvements_summary is None
 
 
 class TestBase:
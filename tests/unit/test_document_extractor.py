@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
-import pytest
-
 from src.documents.extractor import (
+    _EXTRACTION_CONCURRENCY,
     _deduplicate_entities,
     _split_into_windows,
     extract_entities,
@@ -17,7 +17,6 @@ from src.documents.models import ExtractionEntity
 class TestExtractEntities:
     """Tests for extract_entities function."""
 
-    @pytest.mark.asyncio
     @patch("src.documents.extractor.get_settings")
     async def test_disabled_returns_empty(self, mock_settings: MagicMock) -> None:
         """Test that disabled extraction returns empty list."""
@@ -25,7 +24,6 @@ class TestExtractEntities:
         result = await extract_entities("Some text here")
         assert result == []
 
-    @pytest.mark.asyncio
     @patch("src.documents.extractor.get_settings")
     async def test_empty_text_returns_empty(self, mock_settings: MagicMock) -> None:
         """Test that empty text returns empty list."""
@@ -33,7 +31,6 @@ class TestExtractEntities:
         result = await extract_entities("   ")
         assert result == []
 
-    @pytest.mark.asyncio
     @patch("src.documents.extractor.get_settings")
     async def test_handles_llm_failure_gracefully(self, mock_settings: MagicMock) -> None:
         """Test that LLM failures return empty list (non-fatal)."""
@@ -44,7 +41,6 @@ class TestExtractEntities:
         result = await extract_entities("Some text")
         assert isinstance(result, list)
 
-    @pytest.mark.asyncio
     @patch("src.documents.extractor.get_settings")
     async def test_mapreduce_creates_windows_for_long_text(self, mock_settings: MagicMock) -> None:
         """Test that long text is split into windows for MapReduce processing."""
@@ -59,6 +55,27 @@ class TestExtractEntities:
         assert isinstance(result, list)
 
 
+    @patch("src.documents.extractor.get_settings")
+    async def test_map_phase_bounds_concurrency(self, mock_settings: MagicMock) -> None:
+        """Windows run concurrently, but never more than _EXTRACTION_CONCURRENCY at once."""
+        mock_settings.return_value.doc_enable_extraction = True
+        in_flight = peak = 0
+
+        async def fake_extract(text: str, window_idx: int, total_windows: int) -> list[ExtractionEntity]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [ExtractionEntity(entity_type="topic", value=f"w{window_idx}", confidence=0.5)]
+
+        with patch("src.documents.extractor._extract_from_window", side_effect=fake_extract) as mock_extract:
+            result = await extract_entities("A" * 50000)
+
+        assert mock_extract.call_count > _EXTRACTION_CONCURRENCY
+        assert peak == _EXTRACTION_CONCURRENCY
+        assert len(result) == mock_extract.call_count
+
 class TestSplitIntoWindows:
     """Tests for _split_into_windows helper."""
 
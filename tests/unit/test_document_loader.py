@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 import pytest
@@ -18,6 +19,7 @@ from src.documents.loader import (
     _pdfplumber_available,
     _pymupdf_available,
     load_document,
+    load_documents,
 )
 
 
@@ -49,20 +51,17 @@ class TestCountWords:
 class TestLoadDocument:
     """Tests for load_document function."""
 
-    @pytest.mark.asyncio
     async def test_unsupported_extension(self, tmp_path: Path) -> None:
         file = tmp_path / "test.xyz"
         file.write_text("content")
         with pytest.raises(UnsupportedFormatError):
             await load_document(file)
 
-    @pytest.mark.asyncio
     async def test_missing_file(self, tmp_path: Path) -> None:
         file = tmp_path / "nonexistent.pdf"
         with pytest.raises(DocumentProcessingError):
             await load_document(file)
 
-    @pytest.mark.asyncio
     async def test_csv_loading(self, tmp_path: Path) -> None:
         """Test CSV files can be loaded."""
         csv_file = tmp_path / "data.csv"
@@ -78,7 +77,6 @@ class TestLoadDocument:
         assert metadata.word_count is not None
         assert metadata.word_count > 0
 
-    @pytest.mark.asyncio
     async def test_explicit_filename(self, tmp_path: Path) -> None:
         """Test that explicit filename overrides path-based detection."""
         csv_file = tmp_path / "data.csv"
@@ -88,7 +86,6 @@ class TestLoadDocument:
         _text, metadata = await load_document(csv_file, filename="custom_name.csv")
         assert metadata.filename == "custom_name.csv"
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader._load_pdf")
     async def test_pdf_delegates_to_loader(self, mock_load_pdf: AsyncMock, tmp_path: Path) -> None:
         """Test PDF loading delegates to the correct loader."""
@@ -101,7 +98,6 @@ class TestLoadDocument:
         assert metadata.file_type == "pdf"
         assert metadata.extra["pdf_extraction_method"] == "pypdf"
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader._load_docx")
     async def test_docx_delegates_to_loader(self, mock_load_docx: AsyncMock, tmp_path: Path) -> None:
         """Test DOCX loading delegates to the correct loader."""
@@ -113,6 +109,37 @@ class TestLoadDocument:
         assert metadata.file_type == "docx"
 
 
+class TestLoadDocuments:
+    """Tests for concurrent batch loading."""
+
+    async def test_preserves_input_order(self, tmp_path: Path) -> None:
+        documents = []
+        for name in ("alpha", "beta", "gamma"):
+            csv_file = tmp_path / f"{name}.csv"
+            csv_file.write_text(f"Name\n{name}\n")
+            documents.append((csv_file, f"{name}-upload.csv"))
+
+        results = await load_documents(documents, concurrency=2)
+
+        assert [metadata.filename for _, metadata in results] == [
+            "alpha-upload.csv",
+            "beta-upload.csv",
+            "gamma-upload.csv",
+        ]
+        assert [text.splitlines()[-1] for text, _ in results] == ["alpha", "beta", "gamma"]
+
+    async def test_failure_raises_exception_group(self, tmp_path: Path) -> None:
+        good = tmp_path / "good.csv"
+        good.write_text("a,b\n")
+        bad = tmp_path / "bad.xyz"
+        bad.write_text("content")
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await load_documents([(good, None), (bad, None)])
+
+        assert exc_info.group_contains(UnsupportedFormatError)
+
+
 class TestPdfOcrFallback:
     """Tests for tiered PDF OCR fallback in _load_pdf."""
 
@@ -123,7 +150,6 @@ class TestPdfOcrFallback:
         settings.pdf_ocr_min_text_chars = min_chars
         return settings
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader.get_settings")
     @patch("src.documents.loader._pdfplumber_available", return_value=False)
     @patch("src.documents.loader._pymupdf_available", return_value=False)
@@ -157,7 +183,6 @@ class TestPdfOcrFallback:
         assert extra["pdf_ocr_applied"] == "false"
         assert extra["pdf_tiers_attempted"] == "pypdf"
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader.get_settings")
     @patch("src.documents.loader._pdfplumber_available", return_value=True)
     @patch("src.documents.loader._pymupdf_available", return_value=False)
@@ -199,7 +224,6 @@ class TestPdfOcrFallback:
         assert extra["pdf_extraction_method"] == "pdfplumber"
         assert "pdfplumber" in extra["pdf_tiers_attempted"]
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader.get_settings")
     @patch("src.documents.loader._pdfplumber_available", return_value=True)
     @patch("src.documents.loader._pymupdf_available", return_value=True)
@@ -243,7 +267,48 @@ class TestPdfOcrFallback:
         assert extra["pdf_ocr_applied"] == "true"
         assert "pymupdf_ocr" in extra["pdf_tiers_attempted"]
 
-    @pytest.mark.asyncio
+    @patch("src.documents.loader.get_settings")
+    @patch("src.documents.loader._pdfplumber_available", return_value=True)
+    @patch("src.documents.loader._pymupdf_available", return_value=True)
+    async def test_ocr_not_started_when_tier2_sufficient(
+        self,
+        _mock_pymupdf: MagicMock,
+        _mock_pdfplumber: MagicMock,
+        mock_settings: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A sufficient Tier 2 result returns without ever running (or surfacing) OCR."""
+        mock_settings.return_value = self._make_settings(min_chars=50)
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"fake")
+
+        mock_page = MagicMock()
+        mock_page.page_content = "Short"
+
+        pdfplumber_text = "This is a much longer text extracted by pdfplumber from the scanned PDF document."
+
+        with (
+            patch("langchain_community.document_loaders.PyPDFLoader") as mock_loader_cls,
+            patch("src.documents.loader._extract_with_pdfplumber_sync", return_value=pdfplumber_text),
+            patch(
+                "src.documents.loader._extract_with_pymupdf_ocr_sync",
+                side_effect=RuntimeError("tesseract crashed"),
+            ) as mock_ocr,
+        ):
+            mock_loader = MagicMock()
+            mock_loader.aload = AsyncMock(return_value=[mock_page])
+            mock_loader_cls.return_value = mock_loader
+
+            from src.documents.loader import _load_pdf
+
+            text, _page_count, extra = await _load_pdf(pdf_file)
+
+        mock_ocr.assert_not_called()
+        assert text == pdfplumber_text
+        assert extra["pdf_extraction_method"] == "pdfplumber"
+        assert extra["pdf_ocr_applied"] == "false"
+        assert extra["pdf_tiers_attempted"] == "pypdf,pdfplumber"
+
     @patch("src.documents.loader.get_settings")
     @patch("src.documents.loader._pdfplumber_available", return_value=False)
     @patch("src.documents.loader._pymupdf_available", return_value=False)
@@ -275,7 +340,6 @@ class TestPdfOcrFallback:
         assert extra["pdf_extraction_method"] == "pypdf"
         assert extra["pdf_tiers_attempted"] == "pypdf"
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader.get_settings")
     @patch("src.documents.loader._pdfplumber_available", return_value=True)
     @patch("src.documents.loader._pymupdf_available", return_value=True)
@@ -315,7 +379,6 @@ class TestPdfOcrFallback:
         assert "pdfplumber" in extra["pdf_tiers_attempted"]
         assert "pymupdf_ocr" in extra["pdf_tiers_attempted"]
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader.get_settings")
     @patch("src.documents.loader._pdfplumber_available", return_value=True)
     @patch("src.documents.loader._pymupdf_available", return_value=True)
@@ -348,7 +411,6 @@ class TestPdfOcrFallback:
         assert extra["pdf_ocr_applied"] == "false"
         assert extra["pdf_tiers_attempted"] == "pypdf"
 
-    @pytest.mark.asyncio
     @patch("src.documents.loader._load_pdf")
     async def test_extra_metadata_propagated_to_document_metadata(
         self, mock_load_pdf: AsyncMock, tmp_path: Path
@@ -374,6 +436,15 @@ class TestPdfOcrFallback:
 class TestOcrAvailabilityProbes:
     """Tests for the optional dependency probe functions."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_probe_caches(self) -> Iterator[None]:
+        """The probes are cached per process; clear them around each patched sys.modules."""
+        _pdfplumber_available.cache_clear()
+        _pymupdf_available.cache_clear()
+        yield
+        _pdfplumber_available.cache_clear()
+        _pymupdf_available.cache_clear()
+
     @patch.dict("sys.modules", {"pdfplumber": MagicMock()})
     def test_pdfplumber_available_when_installed(self) -> None:
         assert _pdfplumber_available() is True
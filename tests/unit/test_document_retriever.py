@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
-
-import pytest
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.documents.retriever import (
     _build_context,
@@ -14,89 +14,122 @@ from src.documents.retriever import (
     retrieve_document_context,
     retrieve_full_document_text,
 )
+from tests.fixtures.fake_session import FakeSession
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Shared query/chunk embedding (a tuple, so it stays read-only) returned by the generate_embedding mock
+_DUMMY_EMBEDDING = (0.1,) * 768
+
+# Result rows are plain attribute bags; only the result wrappers are mocks
+_row = SimpleNamespace
+
+
+def _scalar_result(value: int) -> Mock:
+    result = Mock(spec_set=["scalar"])
+    result.scalar.return_value = value
+    return result
+
+
+def _rows_result(rows: list[SimpleNamespace]) -> Mock:
+    result = Mock(spec_set=["fetchall"])
+    result.fetchall.return_value = rows
+    return result
+
+
+# Read-only row sets for the two retrieval strategies, built once per module
+_SMALL_DOC_ID = uuid.uuid4()
+# 8 chunks (below _STUFF_THRESHOLD of 50) -> stuff strategy
+_SMALL_CHUNK_ROWS = tuple(
+    _row(
+        content=f"Chunk {i} content",
+        page_number=None,
+        section_title=None,
+        chunk_index=i,
+        document_id=_SMALL_DOC_ID,
+    )
+    for i in range(8)
+)
+_SMALL_DOC_ROW = _row(
+    id=_SMALL_DOC_ID,
+    filename="small.pdf",
+    file_type="pdf",
+    page_count=1,
+    word_count=500,
+    summary="Small doc.",
+    extractions=None,
+)
+
+_LARGE_DOC_ID = uuid.uuid4()
+# top-K chunks (out of 100 total) -> similarity strategy
+_LARGE_CHUNK_ROWS = tuple(
+    _row(
+        content=f"Relevant chunk {i}",
+        page_number=i + 1,
+        section_title=f"Section {i}",
+        chunk_index=i * 5,
+        document_id=_LARGE_DOC_ID,
+        distance=0.1 * i,
+    )
+    for i in range(15)
+)
+_LARGE_DOC_ROW = _row(
+    id=_LARGE_DOC_ID,
+    filename="large.pdf",
+    file_type="pdf",
+    page_count=50,
+    word_count=25000,
+    summary="Large doc.",
+    extractions=[{"entity_type": "topic", "value": "AI Research"}],
+)
 
 
 class TestRetrieveDocumentContext:
     """Tests for retrieve_document_context function."""
 
-    @pytest.mark.asyncio
     @patch("src.documents.retriever.generate_embedding")
     async def test_returns_empty_on_embedding_failure(self, mock_embed: AsyncMock) -> None:
         """Test graceful handling when embedding generation fails."""
         mock_embed.side_effect = RuntimeError("Ollama down")
-        session = AsyncMock()
+        session = FakeSession()
         result = await retrieve_document_context(session, query="test query")
         assert result == ""
 
-    @pytest.mark.asyncio
-    @patch("src.documents.retriever.get_settings")
     @patch("src.documents.retriever.generate_embedding")
     async def test_returns_empty_on_zero_chunks(
         self,
         mock_embed: AsyncMock,
-        mock_settings: MagicMock,
+        fake_settings: Callable[..., SimpleNamespace],
     ) -> None:
         """Test returns empty string when no chunks exist."""
-        mock_embed.return_value = [0.1] * 768
-        mock_settings.return_value.doc_max_chunks_per_query = 15
-
-        session = AsyncMock()
+        mock_embed.return_value = _DUMMY_EMBEDDING
+        fake_settings("src.documents.retriever")
 
         # Count query returns 0
-        count_result = MagicMock()
-        count_result.scalar.return_value = 0
-        session.execute = AsyncMock(return_value=count_result)
+        count_result = _scalar_result(0)
+        session = FakeSession([count_result])
 
         result = await retrieve_document_context(session, query="test")
         assert result == ""
 
-    @pytest.mark.asyncio
-    @patch("src.documents.retriever.get_settings")
     @patch("src.documents.retriever.generate_embedding")
     async def test_stuff_strategy_for_small_docs(
         self,
         mock_embed: AsyncMock,
-        mock_settings: MagicMock,
+        fake_settings: Callable[..., SimpleNamespace],
     ) -> None:
         """Test that small documents use the stuff strategy (all chunks returned)."""
-        mock_embed.return_value = [0.1] * 768
-        mock_settings.return_value.doc_max_chunks_per_query = 15
-
-        doc_id = uuid.uuid4()
-
-        # 8 chunks (below _STUFF_THRESHOLD of 50) -> stuff strategy
-        chunk_rows = []
-        for i in range(8):
-            row = MagicMock()
-            row.content = f"Chunk {i} content"
-            row.page_number = None
-            row.section_title = None
-            row.chunk_index = i
-            row.document_id = doc_id
-            chunk_rows.append(row)
-
-        doc_row = MagicMock()
-        doc_row.id = doc_id
-        doc_row.filename = "small.pdf"
-        doc_row.file_type = "pdf"
-        doc_row.page_count = 1
-        doc_row.word_count = 500
-        doc_row.summary = "Small doc."
-        doc_row.extractions = None
-
-        session = AsyncMock()
+        mock_embed.return_value = _DUMMY_EMBEDDING
+        fake_settings("src.documents.retriever")
 
         # Query 1: count -> 8
-        count_result = MagicMock()
-        count_result.scalar.return_value = 8
+        count_result = _scalar_result(8)
         # Query 2: stuff retrieval -> all 8 chunks
-        chunks_result = MagicMock()
-        chunks_result.fetchall.return_value = chunk_rows
+        chunks_result = _rows_result(list(_SMALL_CHUNK_ROWS))
         # Query 3: document metadata
-        meta_result = MagicMock()
-        meta_result.fetchall.return_value = [doc_row]
-
-        session.execute = AsyncMock(side_effect=[count_result, chunks_result, meta_result])
+        meta_result = _rows_result([_SMALL_DOC_ROW])
+        session = FakeSession([count_result, chunks_result, meta_result])
 
         result = await retrieve_document_context(session, query="test")
         # All 8 chunks should be present (stuff strategy)
@@ -105,54 +138,23 @@ class TestRetrieveDocumentContext:
         assert "small.pdf" in result
         assert "Complete Document Content" in result  # stuff strategy indicator
 
-    @pytest.mark.asyncio
-    @patch("src.documents.retriever.get_settings")
     @patch("src.documents.retriever.generate_embedding")
     async def test_similarity_strategy_for_large_docs(
         self,
         mock_embed: AsyncMock,
-        mock_settings: MagicMock,
+        fake_settings: Callable[..., SimpleNamespace],
     ) -> None:
         """Test that large documents use similarity strategy."""
-        mock_embed.return_value = [0.1] * 768
-        mock_settings.return_value.doc_max_chunks_per_query = 15
-
-        doc_id = uuid.uuid4()
-
-        # top-K chunks (out of 100 total)
-        chunk_rows = []
-        for i in range(15):
-            row = MagicMock()
-            row.content = f"Relevant chunk {i}"
-            row.page_number = i + 1
-            row.section_title = f"Section {i}"
-            row.chunk_index = i * 5
-            row.document_id = doc_id
-            row.distance = 0.1 * i
-            chunk_rows.append(row)
-
-        doc_row = MagicMock()
-        doc_row.id = doc_id
-        doc_row.filename = "large.pdf"
-        doc_row.file_type = "pdf"
-        doc_row.page_count = 50
-        doc_row.word_count = 25000
-        doc_row.summary = "Large doc."
-        doc_row.extractions = [{"entity_type": "topic", "value": "AI Research"}]
-
-        session = AsyncMock()
+        mock_embed.return_value = _DUMMY_EMBEDDING
+        fake_settings("src.documents.retriever")
 
         # Query 1: count -> 100 (above _STUFF_THRESHOLD)
-        count_result = MagicMock()
-        count_result.scalar.return_value = 100
+        count_result = _scalar_result(100)
         # Query 2: similarity retrieval -> top 15
-        chunks_result = MagicMock()
-        chunks_result.fetchall.return_value = chunk_rows
+        chunks_result = _rows_result(list(_LARGE_CHUNK_ROWS))
         # Query 3: document metadata
-        meta_result = MagicMock()
-        meta_result.fetchall.return_value = [doc_row]
-
-        session.execute = AsyncMock(side_effect=[count_result, chunks_result, meta_result])
+        meta_result = _rows_result([_LARGE_DOC_ROW])
+        session = FakeSession([count_result, chunks_result, meta_result])
 
         result = await retrieve_document_context(session, query="test")
         assert "large.pdf" in result
@@ -160,45 +162,40 @@ class TestRetrieveDocumentContext:
         assert "Most Relevant Passages" in result  # similarity strategy indicator
         assert "15/100" in result
 
-    @pytest.mark.asyncio
-    @patch("src.documents.retriever.get_settings")
     @patch("src.documents.retriever.generate_embedding")
     async def test_returns_formatted_context_with_metadata(
         self,
         mock_embed: AsyncMock,
-        mock_settings: MagicMock,
+        fake_settings: Callable[..., SimpleNamespace],
     ) -> None:
         """Test that retrieved chunks include document metadata and entities."""
-        mock_embed.return_value = [0.1] * 768
-        mock_settings.return_value.doc_max_chunks_per_query = 15
+        mock_embed.return_value = _DUMMY_EMBEDDING
+        fake_settings("src.documents.retriever")
 
         doc_id = uuid.uuid4()
 
-        row1 = MagicMock()
-        row1.content = "First chunk content"
-        row1.page_number = 1
-        row1.section_title = "Introduction"
-        row1.chunk_index = 0
-        row1.document_id = doc_id
-
-        doc_row = MagicMock()
-        doc_row.id = doc_id
-        doc_row.filename = "resume.pdf"
-        doc_row.file_type = "pdf"
-        doc_row.page_count = 2
-        doc_row.word_count = 1288
-        doc_row.summary = "A resume."
-        doc_row.extractions = [{"entity_type": "person", "value": "Brandon Colina"}]
-
-        session = AsyncMock()
-        count_result = MagicMock()
-        count_result.scalar.return_value = 1
-        chunks_result = MagicMock()
-        chunks_result.fetchall.return_value = [row1]
-        meta_result = MagicMock()
-        meta_result.fetchall.return_value = [doc_row]
-
-        session.execute = AsyncMock(side_effect=[count_result, chunks_result, meta_result])
+        row1 = _row(
+            content="First chunk content",
+            page_number=1,
+            section_title="Introduction",
+            chunk_index=0,
+            document_id=doc_id,
+        )
+
+        doc_row = _row(
+            id=doc_id,
+            filename="resume.pdf",
+            file_type="pdf",
+            page_count=2,
+            word_count=1288,
+            summary="A resume.",
+            extractions=[{"entity_type": "person", "value": "Brandon Colina"}],
+        )
+
+        count_result = _scalar_result(1)
+        chunks_result = _rows_result([row1])
+        meta_result = _rows_result([doc_row])
+        session = FakeSession([count_result, chunks_result, meta_result])
 
         result = await retrieve_document_context(session, query="test")
         assert "First chunk content" in result
@@ -206,20 +203,17 @@ class TestRetrieveDocumentContext:
         assert "resume.pdf" in result
         assert "Brandon Colina" in result
 
-    @pytest.mark.asyncio
-    @patch("src.documents.retriever.get_settings")
     @patch("src.documents.retriever.generate_embedding")
     async def test_handles_query_failure(
         self,
         mock_embed: AsyncMock,
-        mock_settings: MagicMock,
+        fake_settings: Callable[..., SimpleNamespace],
     ) -> None:
         """Test graceful handling of database query failures."""
-        mock_embed.return_value = [0.1] * 768
-        mock_settings.return_value.doc_max_chunks_per_query = 15
+        mock_embed.return_value = _DUMMY_EMBEDDING
+        fake_settings("src.documents.retriever")
 
-        session = AsyncMock()
-        session.execute = AsyncMock(side_effect=RuntimeError("DB error"))
+        session = FakeSession([RuntimeError("DB error")])
 
         result = await retrieve_document_context(session, query="test")
         assert result == ""
@@ -228,37 +222,33 @@ class TestRetrieveDocumentContext:
 class TestRetrieveFullDocumentText:
     """Tests for retrieve_full_document_text function."""
 
-    @pytest.mark.asyncio
     async def test_returns_empty_for_invalid_ids(self) -> None:
         """Test that invalid UUIDs return empty string."""
-        session = AsyncMock()
+        session = FakeSession()
         result = await retrieve_full_document_text(session, ["not-a-uuid"])
         assert result == ""
 
-    @pytest.mark.asyncio
     async def test_returns_empty_for_empty_ids(self) -> None:
         """Test that empty list returns empty string."""
-        session = AsyncMock()
+        session = FakeSession()
         result = await retrieve_full_document_text(session, [])
         assert result == ""
 
-    @pytest.mark.asyncio
     async def test_returns_full_text_with_metadata(self) -> None:
         """Test that full document text includes metadata and content."""
         doc_id = uuid.uuid4()
-        row = MagicMock()
-        row.id = doc_id
-        row.filename = "report.pdf"
-        row.file_type = "pdf"
-        row.page_count = 10
-        row.word_count = 5000
-        row.raw_text = "Full document content here with all details."
-        row.extractions = [{"entity_type": "topic", "value": "Machine Learning"}]
-
-        session = AsyncMock()
-        query_result = MagicMock()
-        query_result.fetchall.return_value = [row]
-        session.execute = AsyncMock(return_value=query_result)
+        row = _row(
+            id=doc_id,
+            filename="report.pdf",
+            file_type="pdf",
+            page_count=10,
+            word_count=5000,
+            raw_text="Full document content here with all details.",
+            extractions=[{"entity_type": "topic", "value": "Machine Learning"}],
+        )
+
+        query_result = _rows_result([row])
+        session = FakeSession([query_result])
 
         result = await retrieve_full_document_text(session, [str(doc_id)])
         assert "report.pdf" in result
@@ -266,11 +256,9 @@ class TestRetrieveFullDocumentText:
         assert "Machine Learning" in result
         assert "Full document content:" in result
 
-    @pytest.mark.asyncio
     async def test_handles_db_failure(self) -> None:
         """Test graceful handling of database failures."""
-        session = AsyncMock()
-        session.execute = AsyncMock(side_effect=RuntimeError("DB error"))
+        session = FakeSession([RuntimeError("DB error")])
 
         doc_id = uuid.uuid4()
         result = await retrieve_full_document_text(session, [str(doc_id)])
@@ -305,22 +293,24 @@ class TestBuildContext:
     """Tests for _build_context helper."""
 
     def test_stuff_strategy_label(self) -> None:
-        row = MagicMock()
-        row.content = "Some content"
-        row.section_title = None
-        row.page_number = None
-        row.document_id = uuid.uuid4()
+        row = _row(
+            content="Some content",
+            section_title=None,
+            page_number=None,
+            document_id=uuid.uuid4(),
+        )
 
         result = _build_context([row], {}, "stuff", 5)
         assert "Complete Document Content" in result
         assert "5" in result
 
     def test_similarity_strategy_label(self) -> None:
-        row = MagicMock()
-        row.content = "Relevant content"
-        row.section_title = "Intro"
-        row.page_number = 1
-        row.document_id = uuid.uuid4()
+        row = _row(
+            content="Relevant content",
+            section_title="Intro",
+            page_number=1,
+            document_id=uuid.uuid4(),
+        )
 
         result = _build_context([row], {}, "similarity", 100)
         assert "Most Relevant Passages" in result
@@ -3,85 +3,76 @@
 from __future__ import annotations
 
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
-
-import pytest
+from unittest.mock import AsyncMock, patch
 
 from src.documents.models import DocumentChunk
 from src.documents.vectorizer import vectorize_and_store
+from tests.fixtures.fake_session import FakeSession
+
+# Shared chunk embedding (a tuple, so it stays read-only) returned by the generate_embedding mock
+_DUMMY_EMBEDDING = (0.1,) * 768
 
 
 class TestVectorizeAndStore:
     """Tests for vectorize_and_store function."""
 
-    @pytest.mark.asyncio
     @patch("src.documents.vectorizer.generate_embedding")
     async def test_vectorizes_all_chunks(self, mock_embed: AsyncMock) -> None:
         """Test that all chunks get embeddings and are stored."""
-        mock_embed.return_value = [0.1] * 768
+        mock_embed.return_value = _DUMMY_EMBEDDING
 
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
+        session = FakeSession()
 
         doc_id = uuid.uuid4()
         chunks = [
-            DocumentChunk(chunk_index=0, content="First chunk", token_estimate=3),
-            DocumentChunk(chunk_index=1, content="Second chunk", token_estimate=3),
+            DocumentChunk.model_construct(chunk_index=0, content="First chunk", token_estimate=3),
+            DocumentChunk.model_construct(chunk_index=1, content="Second chunk", token_estimate=3),
         ]
 
         records = await vectorize_and_store(session, doc_id, chunks, user_id="user1")
 
         assert len(records) == 2
-        assert session.add.call_count == 2
+        assert len(session.added) == 2
         assert mock_embed.call_count == 2
 
-    @pytest.mark.asyncio
     @patch("src.documents.vectorizer.generate_embedding")
     async def test_skips_failed_embeddings(self, mock_embed: AsyncMock) -> None:
         """Test that individual embedding failures don't stop processing."""
         # First succeeds, second fails
-        mock_embed.side_effect = [[0.1] * 768, RuntimeError("Embed failed")]
+        mock_embed.side_effect = [_DUMMY_EMBEDDING, RuntimeError("Embed failed")]
 
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
+        session = FakeSession()
 
         doc_id = uuid.uuid4()
         chunks = [
-            DocumentChunk(chunk_index=0, content="Good chunk", token_estimate=3),
-            DocumentChunk(chunk_index=1, content="Bad chunk", token_estimate=3),
+            DocumentChunk.model_construct(chunk_index=0, content="Good chunk", token_estimate=3),
+            DocumentChunk.model_construct(chunk_index=1, content="Bad chunk", token_estimate=3),
         ]
 
         records = await vectorize_and_store(session, doc_id, chunks)
 
         assert len(records) == 1
-        assert session.add.call_count == 1
+        assert len(session.added) == 1
 
-    @pytest.mark.asyncio
     @patch("src.documents.vectorizer.generate_embedding")
     async def test_empty_chunks(self, mock_embed: AsyncMock) -> None:
         """Test with empty chunk list."""
-        session = AsyncMock()
-        session.flush = AsyncMock()
+        session = FakeSession()
 
         records = await vectorize_and_store(session, uuid.uuid4(), [])
 
         assert len(records) == 0
         mock_embed.assert_not_called()
 
-    @pytest.mark.asyncio
     @patch("src.documents.vectorizer.generate_embedding")
     async def test_passes_user_and_thread(self, mock_embed: AsyncMock) -> None:
         """Test that user_id and thread_id are passed to records."""
-        mock_embed.return_value = [0.1] * 768
+        mock_embed.return_value = _DUMMY_EMBEDDING
 
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
+        session = FakeSession()
 
         doc_id = uuid.uuid4()
-        chunks = [DocumentChunk(chunk_index=0, content="Test", token_estimate=1)]
+        chunks = [DocumentChunk.model_construct(chunk_index=0, content="Test", token_estimate=1)]
 
         records = await vectorize_and_store(
             session,
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.embeddings.service import (
     _build_summary_text,
     find_similar_evaluations,
@@ -56,7 +54,6 @@ class TestBuildSummaryText:
 
 
 class TestGenerateEmbedding:
-    @pytest.mark.asyncio
     async def test_calls_embeddings_model(self):
         mock_embedding = [0.1] * 768
         with patch("src.embeddings.service._get_embeddings_model") as mock_model:
@@ -72,7 +69,6 @@ class TestGenerateEmbedding:
 
 
 class TestStoreEvaluationEmbedding:
-    @pytest.mark.asyncio
     async def test_stores_embedding_record(self):
         mock_embedding = [0.1] * 768
         mock_session = AsyncMock()
@@ -100,7 +96,6 @@ class TestStoreEvaluationEmbedding:
             assert result.overall_score == 65
             assert result.grade == "Good"
 
-    @pytest.mark.asyncio
     async def test_stores_with_thread_id(self):
         mock_embedding = [0.1] * 768
         mock_session = AsyncMock()
@@ -125,7 +120,6 @@ class TestStoreEvaluationEmbedding:
             assert result.thread_id == "thread-abc-123"
             mock_session.add.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_stores_with_anonymous_user(self):
         mock_embedding = [0.1] * 768
         mock_session = AsyncMock()
@@ -150,7 +144,6 @@ class TestStoreEvaluationEmbedding:
 
 
 class TestFindSimilarEvaluations:
-    @pytest.mark.asyncio
     async def test_returns_similar_evaluations(self):
         mock_embedding = [0.1] * 768
         mock_row = MagicMock()
@@ -181,7 +174,6 @@ class TestFindSimilarEvaluations:
             assert results[0]["overall_score"] == 72
             assert results[0]["distance"] == 0.15
 
-    @pytest.mark.asyncio
     async def test_empty_results(self):
         mock_embedding = [0.1] * 768
         mock_result = MagicMock()
@@ -200,7 +192,6 @@ class TestFindSimilarEvaluations:
 
             assert results == []
 
-    @pytest.mark.asyncio
     async def test_uses_custom_limit_and_threshold(self):
         mock_embedding = [0.1] * 768
         mock_result = MagicMock()
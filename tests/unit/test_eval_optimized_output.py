@@ -2,14 +2,11 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.agent.nodes.output_evaluator import evaluate_optimized_output
 from src.evaluator import TaskType
 
 
 class TestEvaluateOptimizedOutput:
-    @pytest.mark.asyncio
     async def test_skips_when_no_optimized_output(self):
         state = {
             "input_text": "test",
@@ -20,7 +17,6 @@ class TestEvaluateOptimizedOutput:
         assert result["optimized_output_evaluation"] is None
         assert result["current_step"] == "optimized_output_evaluated"
 
-    @pytest.mark.asyncio
     async def test_skips_when_no_rewritten_prompt(self):
         state = {
             "input_text": "test",
@@ -31,7 +27,6 @@ class TestEvaluateOptimizedOutput:
 
         assert result["optimized_output_evaluation"] is None
 
-    @pytest.mark.asyncio
     async def test_evaluates_when_both_present(self):
         from src.evaluator.llm_schemas import OutputEvaluationLLMResponse
 
@@ -73,7 +68,6 @@ class TestEvaluateOptimizedOutput:
         assert result["optimized_output_evaluation"] is not None
         assert result["current_step"] == "optimized_output_evaluated"
 
-    @pytest.mark.asyncio
     async def test_handles_exception_gracefully(self):
         mock_llm = AsyncMock()
 
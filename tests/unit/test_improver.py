@@ -2,8 +2,6 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.agent.nodes.improver import (
     _build_analysis_summary,
     _build_evaluation_result,
@@ -232,7 +230,6 @@ class TestBuildEvaluationResult:
 
 
 class TestGenerateImprovements:
-    @pytest.mark.asyncio
     async def test_returns_improvements(self):
         mock_response = ImprovementsLLMResponse(
             improvements=[
@@ -268,7 +265,6 @@ class TestGenerateImprovements:
             assert result["should_continue"] is False
             assert result["evaluation_result"] is not None
 
-    @pytest.mark.asyncio
     async def test_fallback_on_none(self):
         with patch("src.agent.nodes.improver.get_llm") as mock_llm, \
              patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock) as mock_invoke, \
@@ -292,7 +288,6 @@ class TestGenerateImprovements:
             assert result["improvements"] == []
             assert result["rewritten_prompt"] is None
 
-    @pytest.mark.asyncio
     async def test_with_output_evaluation(self):
         mock_response = ImprovementsLLMResponse(
             improvements=[
@@ -341,7 +336,6 @@ class TestGenerateImprovements:
             assert "output_quality_section" in call_vars
             assert "Completeness" in call_vars["output_quality_section"]
 
-    @pytest.mark.asyncio
     async def test_uses_initial_prompt_type_guidance(self):
         mock_response = ImprovementsLLMResponse(
             improvements=[],
@@ -374,7 +368,6 @@ class TestGenerateImprovements:
             assert PROMPT_TYPE_INITIAL in system_msg.content
             assert PROMPT_TYPE_CONTINUATION not in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_uses_continuation_prompt_type_guidance(self):
         mock_response = ImprovementsLLMResponse(
             improvements=[],
@@ -406,7 +399,6 @@ class TestGenerateImprovements:
             assert PROMPT_TYPE_CONTINUATION in system_msg.content
             assert PROMPT_TYPE_INITIAL not in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_defaults_to_initial_when_prompt_type_missing(self):
         mock_response = ImprovementsLLMResponse(
             improvements=[],
@@ -437,7 +429,6 @@ class TestGenerateImprovements:
             system_msg = call_prompt.messages[0]
             assert PROMPT_TYPE_INITIAL in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_email_task_type_appends_email_guidance(self):
         from src.evaluator import TaskType
 
@@ -472,7 +463,6 @@ class TestGenerateImprovements:
             assert EMAIL_IMPROVEMENT_GUIDANCE in system_msg.content
             assert PROMPT_TYPE_INITIAL in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_general_task_type_does_not_append_email_guidance(self):
         from src.evaluator import TaskType
 
@@ -506,7 +496,6 @@ class TestGenerateImprovements:
             system_msg = call_prompt.messages[0]
             assert EMAIL_IMPROVEMENT_GUIDANCE not in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_summarization_task_type_appends_summarization_guidance(self):
         from src.evaluator import TaskType
 
@@ -541,7 +530,6 @@ class TestGenerateImprovements:
             assert SUMMARIZATION_IMPROVEMENT_GUIDANCE in system_msg.content
             assert PROMPT_TYPE_INITIAL in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_summarization_task_type_does_not_append_email_guidance(self):
         from src.evaluator import TaskType
 
@@ -4,8 +4,6 @@ import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import pytest
-
 from src.rag.knowledge_store import (
     _load_criteria_doc,
     _load_domain_configs,
@@ -68,7 +66,6 @@ class TestLoadDomainConfigs:
 
 
 class TestRetrieveContext:
-    @pytest.mark.asyncio
     async def test_returns_string(self):
         """Test that retrieve_context returns a string (may be empty if embeddings fail)."""
         # Mock the store to avoid needing real embeddings
@@ -84,7 +81,6 @@ class TestRetrieveContext:
             assert isinstance(result, str)
             assert "Task dimension" in result
 
-    @pytest.mark.asyncio
     async def test_empty_results(self):
         mock_store = MagicMock()
         mock_store.similarity_search.return_value = []
@@ -93,13 +89,11 @@ class TestRetrieveContext:
             result = await retrieve_context("random query")
             assert result == ""
 
-    @pytest.mark.asyncio
     async def test_exception_returns_empty(self):
         with patch("src.rag.knowledge_store._get_store", side_effect=RuntimeError("store broken")):
             result = await retrieve_context("test query")
             assert result == ""
 
-    @pytest.mark.asyncio
     async def test_multiple_results_joined(self):
         docs = [
             MagicMock(page_content="Chunk 1 content", metadata={"source": "a.md"}),
@@ -115,7 +109,6 @@ class TestRetrieveContext:
             assert "Chunk 2" in result
             assert "---" in result
 
-    @pytest.mark.asyncio
     async def test_top_k_parameter_passed(self):
         mock_store = MagicMock()
         mock_store.similarity_search.return_value = []
@@ -2,8 +2,6 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.agent.nodes.meta_evaluator import (
     _build_dimension_summary,
     _build_improvements_text,
@@ -83,7 +81,6 @@ class TestBuildImprovementsText:
 
 
 class TestMetaEvaluate:
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.meta_evaluator.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.meta_evaluator.get_llm")
     async def test_happy_path(self, mock_get_llm, mock_invoke):
@@ -109,7 +106,6 @@ class TestMetaEvaluate:
         assert len(result["meta_findings"]) == 2
         assert "improvements" not in result  # No refined improvements in this response
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.meta_evaluator.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.meta_evaluator.get_llm")
     async def test_with_refined_improvements(self, mock_get_llm, mock_invoke):
@@ -134,7 +130,6 @@ class TestMetaEvaluate:
         assert len(result["improvements"]) == 2  # original + refined
         assert result["improvements"][1].title.startswith("[Meta]")
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.meta_evaluator.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.meta_evaluator.get_llm")
     async def test_with_refined_rewritten_prompt(self, mock_get_llm, mock_invoke):
@@ -156,7 +151,6 @@ class TestMetaEvaluate:
         result = await meta_evaluate(state)
         assert result["rewritten_prompt"] == "Even better prompt"
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.meta_evaluator.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.meta_evaluator.get_llm")
     async def test_no_result_graceful_fallback(self, mock_get_llm, mock_invoke):
@@ -179,7 +173,6 @@ class TestMetaEvaluate:
         assert result["meta_assessment"] is None
         assert "Meta-evaluation could not produce" in result["meta_findings"][0]
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.meta_evaluator.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.meta_evaluator.get_llm")
     async def test_llm_failure_graceful_fallback(self, mock_get_llm, mock_invoke):
@@ -202,7 +195,6 @@ class TestMetaEvaluate:
         assert result["meta_assessment"] is None
         assert "Meta-evaluation failed" in result["meta_findings"][0]
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.meta_evaluator.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.meta_evaluator.get_llm")
     async def test_fatal_error_returns_error_message(self, mock_get_llm, mock_invoke):
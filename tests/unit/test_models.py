@@ -74,6 +74,20 @@ class TestTCREIFlags:
         assert flags.context
         assert not flags.references
 
+    def test_mask_round_trip(self):
+        flags = TCREIFlags(task=True, references=True, iterate=True)
+        assert flags.to_mask() == 0b10101
+        assert TCREIFlags.from_mask(flags.to_mask()) == flags
+
+    def test_empty_mask(self):
+        assert TCREIFlags().to_mask() == 0
+        assert TCREIFlags.from_mask(0) == TCREIFlags()
+
+    def test_mask_bits_follow_field_order(self):
+        for i, name in enumerate(TCREIFlags.model_fields):
+            assert TCREIFlags(**{name: True}).to_mask() == 1 << i
+            assert getattr(TCREIFlags.from_mask(1 << i), name)
+
 
 class TestImprovement:
     def test_priority_ordering(self):
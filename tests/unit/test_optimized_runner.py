@@ -2,13 +2,10 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.agent.nodes.optimized_runner import run_optimized_prompt
 
 
 class TestRunOptimizedPrompt:
-    @pytest.mark.asyncio
     async def test_returns_optimized_outputs(self):
         mock_response = MagicMock()
         mock_response.content = "Optimized output result."
@@ -30,7 +27,6 @@ class TestRunOptimizedPrompt:
         assert result["current_step"] == "optimized_output_generated"
         assert "messages" in result
 
-    @pytest.mark.asyncio
     async def test_skips_when_no_rewritten_prompt(self):
         state = {"session_id": "test"}
         result = await run_optimized_prompt(state)
@@ -39,7 +35,6 @@ class TestRunOptimizedPrompt:
         assert result["optimized_output_summary"] is None
         assert result["current_step"] == "optimized_output_generated"
 
-    @pytest.mark.asyncio
     async def test_skips_when_empty_rewritten_prompt(self):
         state = {"rewritten_prompt": "", "session_id": "test"}
         result = await run_optimized_prompt(state)
@@ -47,7 +42,6 @@ class TestRunOptimizedPrompt:
         assert result["optimized_outputs"] is None
         assert result["optimized_output_summary"] is None
 
-    @pytest.mark.asyncio
     async def test_defaults_to_two_executions(self):
         mock_response = MagicMock()
         mock_response.content = "Output"
@@ -65,7 +59,6 @@ class TestRunOptimizedPrompt:
         assert len(result["optimized_outputs"]) == 2
         assert mock_llm.ainvoke.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_handles_partial_failures(self):
         call_count = 0
 
@@ -97,7 +90,6 @@ class TestRunOptimizedPrompt:
         assert len(error_outputs) == 1
         assert len(success_outputs) == 1
 
-    @pytest.mark.asyncio
     async def test_respects_execution_count(self):
         mock_response = MagicMock()
         mock_response.content = "Output"
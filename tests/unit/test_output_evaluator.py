@@ -2,8 +2,6 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.agent.nodes.output_evaluator import (
     _empty_output_evaluation,
     _map_output_evaluation,
@@ -136,7 +134,6 @@ class TestEmptyOutputEvaluation:
 
 
 class TestEvaluateOutput:
-    @pytest.mark.asyncio
     async def test_evaluate_output_success(self):
         """Test success path using invoke_structured."""
         mock_settings = MagicMock()
@@ -164,7 +161,6 @@ class TestEvaluateOutput:
             assert result["output_evaluation"].overall_score == 0.84
             assert len(result["output_evaluation"].dimensions) == 5
 
-    @pytest.mark.asyncio
     async def test_evaluate_output_total_failure(self):
         """Test that total parsing failure returns fallback with 5 dimensions."""
         mock_settings = MagicMock()
@@ -191,7 +187,6 @@ class TestEvaluateOutput:
             assert result["output_evaluation"].grade == Grade.WEAK
             assert len(result["output_evaluation"].dimensions) == 5
 
-    @pytest.mark.asyncio
     async def test_evaluate_output_email_task_type_uses_email_prompt(self):
         """Test that email task type selects the email output evaluation prompt."""
         from src.evaluator import TaskType
@@ -227,7 +222,6 @@ class TestEvaluateOutput:
             system_msg = call_prompt.messages[0]
             assert "Tone Appropriateness" in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_evaluate_output_summarization_task_type_uses_summarization_prompt(self):
         """Test that summarization task type selects the summarization output evaluation prompt."""
         from src.evaluator import TaskType
@@ -263,7 +257,6 @@ class TestEvaluateOutput:
             system_msg = call_prompt.messages[0]
             assert "Information Accuracy" in system_msg.content
 
-    @pytest.mark.asyncio
     async def test_scores_dimensions_in_langsmith(self):
         """Test that LangSmith scoring is called for each dimension."""
         mock_settings = MagicMock()
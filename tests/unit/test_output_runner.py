@@ -2,8 +2,6 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.agent.nodes.output_runner import (
     _format_multi_output,
     _run_n_times,
@@ -12,7 +10,6 @@ from src.agent.nodes.output_runner import (
 
 
 class TestRunNTimes:
-    @pytest.mark.asyncio
     async def test_runs_n_times(self):
         mock_response = MagicMock()
         mock_response.content = "Output text"
@@ -24,7 +21,6 @@ class TestRunNTimes:
         assert len(results) == 3
         assert mock_llm.ainvoke.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_handles_partial_failures(self):
         call_count = 0
 
@@ -60,7 +56,6 @@ class TestFormatMultiOutput:
 
 
 class TestRunPromptForOutput:
-    @pytest.mark.asyncio
     async def test_returns_llm_output_and_original_outputs(self):
         mock_response = MagicMock()
         mock_response.content = "Dogs are wonderful companions."
@@ -79,7 +74,6 @@ class TestRunPromptForOutput:
             assert result["current_step"] == "output_generated"
             assert "messages" in result
 
-    @pytest.mark.asyncio
     async def test_defaults_to_two_executions(self):
         mock_response = MagicMock()
         mock_response.content = "Output"
@@ -94,7 +88,6 @@ class TestRunPromptForOutput:
             assert len(result["original_outputs"]) == 2
             assert mock_llm.ainvoke.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_respects_execution_count(self):
         mock_response = MagicMock()
         mock_response.content = "Output"
@@ -109,7 +102,6 @@ class TestRunPromptForOutput:
             assert len(result["original_outputs"]) == 4
             assert mock_llm.ainvoke.call_count == 4
 
-    @pytest.mark.asyncio
     async def test_handles_llm_exception(self):
         """Test that LLM errors are caught and produce error content."""
         mock_llm = AsyncMock()
@@ -124,7 +116,6 @@ class TestRunPromptForOutput:
             for output in result["original_outputs"]:
                 assert "[Error:" in output
 
-    @pytest.mark.asyncio
     async def test_handles_non_string_content(self):
         mock_response = MagicMock()
         mock_response.content = ["chunk1", "chunk2"]
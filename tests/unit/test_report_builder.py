@@ -2,8 +2,6 @@
 
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 from src.agent.nodes.report_builder import _summarize_improvements, build_report
 from src.evaluator import (
     DimensionScore,
@@ -69,7 +67,6 @@ class TestSummarizeImprovements:
 
 
 class TestBuildReport:
-    @pytest.mark.asyncio
     async def test_structure_only_report(self):
         state = {
             "input_text": "Test prompt",
@@ -93,7 +90,6 @@ class TestBuildReport:
         assert report.rewritten_prompt == "Better prompt"
         assert any("[Structure/T.C.R.E.I.]" in f for f in report.combined_findings)
 
-    @pytest.mark.asyncio
     async def test_output_only_report(self):
         state = {
             "input_text": "Test prompt",
@@ -116,7 +112,6 @@ class TestBuildReport:
         assert report.output_result is not None
         assert any("[Output/LangSmith]" in f for f in report.combined_findings)
 
-    @pytest.mark.asyncio
     async def test_full_report(self):
         state = {
             "input_text": "Test prompt",
@@ -142,7 +137,6 @@ class TestBuildReport:
         assert has_structure
         assert has_output
 
-    @pytest.mark.asyncio
     async def test_combined_findings_format(self):
         state = {
             "input_text": "Test",
@@ -168,7 +162,6 @@ class TestBuildReport:
         output_findings = [f for f in report.combined_findings if "[Output/LangSmith]" in f]
         assert len(output_findings) == 2
 
-    @pytest.mark.asyncio
     async def test_report_state_fields(self):
         state = {
             "input_text": "Test",
@@ -189,7 +182,6 @@ class TestBuildReport:
         assert result["should_continue"] is False
         assert "messages" in result
 
-    @pytest.mark.asyncio
     async def test_defaults_to_structure_phase(self):
         state = {
             "input_text": "Test",
@@ -206,7 +198,6 @@ class TestBuildReport:
             result = await build_report(state)
         assert result["full_report"].phase == EvalPhase.STRUCTURE
 
-    @pytest.mark.asyncio
     async def test_embedding_storage_called(self):
         state = {
             "input_text": "Test prompt",
@@ -226,7 +217,6 @@ class TestBuildReport:
             await build_report(state)
             mock_store.assert_called_once_with(state)
 
-    @pytest.mark.asyncio
     async def test_embedding_failure_does_not_break_report(self):
         state = {
             "input_text": "Test prompt",
@@ -19,7 +19,6 @@ def mock_session():
 
 
 class TestEvaluationRepository:
-    @pytest.mark.asyncio
     async def test_save(self, mock_session):
         repo = EvaluationRepository(mock_session)
         result = EvaluationResult(
@@ -48,7 +47,6 @@ class TestEvaluationRepository:
         assert evaluation.mode == "prompt"
         assert evaluation.overall_score == 75
 
-    @pytest.mark.asyncio
     async def test_save_with_thread_id(self, mock_session):
         repo = EvaluationRepository(mock_session)
         result = EvaluationResult(
@@ -72,7 +70,6 @@ class TestEvaluationRepository:
         mock_session.flush.assert_awaited_once()
         assert evaluation.thread_id == "thread-abc"
 
-    @pytest.mark.asyncio
     async def test_get_by_id(self, mock_session):
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = MagicMock(id=uuid4())
@@ -84,7 +81,6 @@ class TestEvaluationRepository:
         mock_session.execute.assert_awaited_once()
         assert evaluation is not None
 
-    @pytest.mark.asyncio
     async def test_get_by_id_not_found(self, mock_session):
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -95,7 +91,6 @@ class TestEvaluationRepository:
 
         assert evaluation is None
 
-    @pytest.mark.asyncio
     async def test_get_by_session(self, mock_session):
         mock_scalars = MagicMock()
         mock_scalars.all.return_value = [MagicMock(), MagicMock()]
@@ -111,7 +106,6 @@ class TestEvaluationRepository:
 
 
 class TestConfigRepository:
-    @pytest.mark.asyncio
     async def test_get_default(self, mock_session):
         mock_config = MagicMock()
         mock_config.name = "default"
@@ -125,7 +119,6 @@ class TestConfigRepository:
         assert config is not None
         assert config.name == "default"
 
-    @pytest.mark.asyncio
     async def test_get_default_not_found(self, mock_session):
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -136,7 +129,6 @@ class TestConfigRepository:
 
         assert config is None
 
-    @pytest.mark.asyncio
     async def test_get_by_name(self, mock_session):
         mock_config = MagicMock()
         mock_config.name = "healthcare"
@@ -149,7 +141,6 @@ class TestConfigRepository:
 
         assert config.name == "healthcare"
 
-    @pytest.mark.asyncio
     async def test_get_by_name_not_found(self, mock_session):
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -1,14 +1,10 @@
 """Unit tests for the scorer node."""
 
-
-import pytest
-
 from src.agent.nodes.scorer import score_prompt
 from src.evaluator import DimensionScore
 
 
 class TestScorePrompt:
-    @pytest.mark.asyncio
     async def test_weighted_scoring(self):
         state = {
             "dimension_scores": [
@@ -23,7 +19,6 @@ class TestScorePrompt:
         assert result["grade"] == "Excellent"
         assert result["current_step"] == "scoring_complete"
 
-    @pytest.mark.asyncio
     async def test_zero_scores(self):
         state = {
             "dimension_scores": [
@@ -37,7 +32,6 @@ class TestScorePrompt:
         assert result["overall_score"] == 0
         assert result["grade"] == "Weak"
 
-    @pytest.mark.asyncio
     async def test_mixed_scores(self):
         state = {
             "dimension_scores": [
@@ -52,21 +46,18 @@ class TestScorePrompt:
         assert 60 <= result["overall_score"] <= 70
         assert result["grade"] in ("Good", "Needs Work")
 
-    @pytest.mark.asyncio
     async def test_empty_dimensions(self):
         state = {"dimension_scores": []}
         result = await score_prompt(state)
         assert result["overall_score"] == 0
         assert result["grade"] == "Weak"
 
-    @pytest.mark.asyncio
     async def test_no_dimensions_key(self):
         state = {}
         result = await score_prompt(state)
         assert result["overall_score"] == 0
         assert result["grade"] == "Weak"
 
-    @pytest.mark.asyncio
     async def test_message_content(self):
         state = {
             "dimension_scores": [
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 from src.evaluator import (
     EvalPhase,
     FullEvaluationReport,
@@ -60,7 +58,6 @@ class TestPromptEvaluationService:
 
 
 class TestEvaluateMethod:
-    @pytest.mark.asyncio
     async def test_success_returns_report(self):
         full_report = FullEvaluationReport(
             phase=EvalPhase.FULL,
@@ -87,7 +84,6 @@ class TestEvaluateMethod:
         assert result.overall_score == 75
         assert result.grade == "Good"
 
-    @pytest.mark.asyncio
     async def test_fatal_error_returns_error_report(self):
         async def mock_stream(initial_state, stream_mode=None):
             yield {"analyze_prompt": {"error_message": "Fatal: billing issue"}}
@@ -102,7 +98,6 @@ class TestEvaluateMethod:
         assert result.error == "Fatal: billing issue"
         assert result.full_report is None
 
-    @pytest.mark.asyncio
     async def test_no_report_returns_error(self):
         async def mock_stream(initial_state, stream_mode=None):
             yield {"build_report": {"some_key": "but no full_report"}}
@@ -116,7 +111,6 @@ class TestEvaluateMethod:
 
         assert result.error == "Evaluation produced no report."
 
-    @pytest.mark.asyncio
     async def test_unexpected_exception_returns_error(self):
         async def mock_stream(initial_state, stream_mode=None):
             raise RuntimeError("connection lost")
@@ -132,7 +126,6 @@ class TestEvaluateMethod:
         assert result.error is not None
         assert "RuntimeError" in result.error
 
-    @pytest.mark.asyncio
     async def test_default_strategy_always_used(self):
         """Service always uses get_default_strategy() internally."""
         captured_state = {}
@@ -161,7 +154,6 @@ class TestEvaluateMethod:
         assert strategy.use_tot is expected.use_tot
         assert strategy.use_meta is expected.use_meta
 
-    @pytest.mark.asyncio
     async def test_execution_count_passed_to_initial_state(self):
         """execution_count parameter is forwarded into the graph initial state."""
         captured_state = {}
@@ -185,7 +177,6 @@ class TestEvaluateMethod:
 
         assert captured_state["execution_count"] == 4
 
-    @pytest.mark.asyncio
     async def test_execution_count_defaults_to_two(self):
         """execution_count defaults to 2 when not specified."""
         captured_state = {}
@@ -209,7 +200,6 @@ class TestEvaluateMethod:
 
         assert captured_state["execution_count"] == 2
 
-    @pytest.mark.asyncio
     async def test_meta_assessment_propagated(self):
         meta = MetaAssessment(
             accuracy_score=0.9,
@@ -244,7 +234,6 @@ class TestEvaluateMethod:
         assert result.meta_assessment.overall_confidence == 0.88
         assert result.strategy_used == "enhanced (CoT+ToT+Meta)"
 
-    @pytest.mark.asyncio
     async def test_llm_provider_override(self):
         captured_state = {}
 
@@ -267,7 +256,6 @@ class TestEvaluateMethod:
 
         assert captured_state["llm_provider"] == "anthropic"
 
-    @pytest.mark.asyncio
     async def test_optimized_output_evaluation_propagated(self):
         """optimized_output_evaluation from graph state is propagated to the report."""
         optimized_eval = OutputEvaluationResult(
@@ -3,8 +3,6 @@
 import logging
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from src.evaluator.llm_schemas import AnalysisLLMResponse, FollowupLLMResponse
 from src.utils.structured_output import (
     _extract_json,
@@ -189,7 +187,6 @@ class TestIsOllamaModel:
 
 
 class TestInvokeStructured:
-    @pytest.mark.asyncio
     async def test_structured_output_success(self):
         """Test that native structured output works when supported."""
         expected = FollowupLLMResponse(intent="explain", response="Details here")
@@ -209,7 +206,6 @@ class TestInvokeStructured:
         assert result.intent == "explain"
         assert result.response == "Details here"
 
-    @pytest.mark.asyncio
     async def test_structured_output_returns_dict(self):
         """Test that a dict return from structured output is validated."""
         mock_chain = AsyncMock()
@@ -225,7 +221,6 @@ class TestInvokeStructured:
         assert result is not None
         assert result.intent == "explain"
 
-    @pytest.mark.asyncio
     async def test_fallback_to_json_parsing(self):
         """Test fallback to JSON parsing when structured output fails."""
         mock_prompt = MagicMock()
@@ -247,7 +242,6 @@ class TestInvokeStructured:
         assert result.intent == "re_evaluate"
         assert result.new_prompt == "new"
 
-    @pytest.mark.asyncio
     async def test_fallback_with_code_block(self):
         """Test fallback handles JSON in code blocks."""
         mock_prompt = MagicMock()
@@ -265,7 +259,6 @@ class TestInvokeStructured:
         assert result is not None
         assert result.intent == "explain"
 
-    @pytest.mark.asyncio
     async def test_total_failure_returns_none(self):
         """Test that None is returned when all parsing attempts fail."""
         mock_prompt = MagicMock()
@@ -282,7 +275,6 @@ class TestInvokeStructured:
         result = await invoke_structured(mock_llm, mock_prompt, {}, FollowupLLMResponse)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_structured_output_general_exception_triggers_fallback(self):
         """Test that a general exception in structured output triggers fallback."""
         mock_prompt = MagicMock()
@@ -300,7 +292,6 @@ class TestInvokeStructured:
         assert result is not None
         assert result.response == "fallback worked"
 
-    @pytest.mark.asyncio
     async def test_analysis_schema(self):
         """Test with AnalysisLLMResponse schema."""
         mock_prompt = MagicMock()
@@ -325,7 +316,6 @@ class TestInvokeStructured:
         assert result.dimensions["task"].score == 75
         assert result.tcrei_flags.task is True
 
-    @pytest.mark.asyncio
     async def test_logs_truncation_warning(self, caplog):
         """Test that a truncated response logs a warning with length info."""
         mock_prompt = MagicMock()
@@ -347,7 +337,6 @@ class TestInvokeStructured:
         assert any("appears truncated" in msg for msg in caplog.messages)
         assert any(f"length={len(truncated_content)}" in msg for msg in caplog.messages)
 
-    @pytest.mark.asyncio
     async def test_logs_response_length_on_parse_failure(self, caplog):
         """Test that JSON parse failure includes response_length in log."""
         mock_prompt = MagicMock()
@@ -368,7 +357,6 @@ class TestInvokeStructured:
         assert result is None
         assert any(f"response_length={len(bad_content)}" in msg for msg in caplog.messages)
 
-    @pytest.mark.asyncio
     async def test_gemini_thinking_list_content_fallback(self):
         """Test that Gemini thinking model list content is properly extracted."""
         mock_prompt = MagicMock()
@@ -391,7 +379,6 @@ class TestInvokeStructured:
         assert result.intent == "explain"
         assert result.response == "from thinking model"
 
-    @pytest.mark.asyncio
     async def test_google_model_skips_structured_output(self):
         """Google models should skip with_structured_output and use raw JSON parsing."""
         mock_prompt = MagicMock()
@@ -415,7 +402,6 @@ class TestInvokeStructured:
         # with_structured_output should NEVER be called for Google models
         mock_llm.with_structured_output.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_non_google_model_uses_structured_output(self):
         """Non-Google models should try with_structured_output first."""
         expected = FollowupLLMResponse(intent="explain", response="direct output")
@@ -433,7 +419,6 @@ class TestInvokeStructured:
         assert result.intent == "explain"
         mock_llm.with_structured_output.assert_called_once_with(FollowupLLMResponse)
 
-    @pytest.mark.asyncio
     async def test_structured_output_returns_none_logs_warning(self, caplog):
         """Test that Attempt 1 returning None/unexpected type logs a warning."""
         mock_prompt = MagicMock()
@@ -511,7 +496,6 @@ class TestIsEmptyResult:
 class TestInvokeStructuredEmptyResultFallback:
     """Tests for the empty-result detection and fallback in invoke_structured."""
 
-    @pytest.mark.asyncio
     async def test_empty_structured_result_falls_through_to_json(self, caplog):
         """When structured output returns all-default values (Gemini empty JSON),
         invoke_structured should fall through to the JSON fallback path."""
@@ -551,7 +535,6 @@ class TestInvokeStructuredEmptyResultFallback:
         assert result.dimensions["task"].score == 80
         assert any("all-default values" in msg for msg in caplog.messages)
 
-    @pytest.mark.asyncio
     async def test_empty_dict_result_falls_through_to_json(self, caplog):
         """When structured output returns an empty dict (Gemini {}),
         invoke_structured should detect all-defaults and fall through."""
@@ -587,7 +570,6 @@ class TestInvokeStructuredEmptyResultFallback:
         assert result.response == "Better prompt here"
         assert any("all-defaults" in msg for msg in caplog.messages)
 
-    @pytest.mark.asyncio
     async def test_non_empty_structured_result_returned_directly(self):
         """When structured output returns a real populated result, it should
         be returned immediately without falling through to JSON."""
@@ -608,7 +590,6 @@ class TestInvokeStructuredEmptyResultFallback:
         assert result.intent == "re_evaluate"
         assert result.response == "Real content"
 
-    @pytest.mark.asyncio
     async def test_google_model_uses_raw_json_directly(self, caplog):
         """Google models should skip structured output entirely and use raw JSON,
         which produces complete results with all dimensions."""
@@ -638,7 +619,6 @@ class TestInvokeStructuredEmptyResultFallback:
         # with_structured_output should NOT be called
         mock_llm.with_structured_output.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_google_model_with_thinking_content_blocks(self):
         """Google models with thinking enabled should extract text from content blocks."""
         mock_prompt = MagicMock()
@@ -667,7 +647,6 @@ class TestInvokeStructuredEmptyResultFallback:
         assert result.intent == "explain"
         assert result.response == "From thinking model"
 
-    @pytest.mark.asyncio
     async def test_typed_content_blocks_extraction(self):
         """Test that typed LangChain content block objects (not dicts) are handled."""
         mock_prompt = MagicMock()
@@ -2,8 +2,6 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.agent.nodes.improver import _generate_tot_improvements, generate_improvements
 from src.evaluator import EvalMode, TCREIFlags
 from src.evaluator.llm_schemas import (
@@ -45,7 +43,6 @@ def _default_tcrei_flags() -> TCREIFlags:
 
 
 class TestGenerateToTImprovements:
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     async def test_happy_path_branch_and_select(self, mock_invoke):
         branches = _make_branches_response(3)
@@ -66,7 +63,6 @@ class TestGenerateToTImprovements:
         assert len(result["improvements"]) == 1
         assert result["rewritten_prompt"] == "Synthesized best prompt"
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     async def test_selection_failure_uses_highest_confidence(self, mock_invoke):
         branches = _make_branches_response(3)
@@ -86,7 +82,6 @@ class TestGenerateToTImprovements:
         # Branch 3 has highest confidence (0.9)
         assert result["rewritten_prompt"] == "Rewritten prompt branch 3"
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     async def test_branch_generation_failure_returns_none(self, mock_invoke):
         mock_invoke.return_value = None
@@ -102,7 +97,6 @@ class TestGenerateToTImprovements:
 
         assert result is None
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     async def test_empty_branches_returns_none(self, mock_invoke):
         mock_invoke.return_value = ToTBranchesLLMResponse(branches=[])
@@ -118,7 +112,6 @@ class TestGenerateToTImprovements:
 
         assert result is None
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     async def test_null_branch_index_uses_highest_confidence(self, mock_invoke):
         """When LLM returns null for selected_branch_index, use highest confidence."""
@@ -146,7 +139,6 @@ class TestGenerateToTImprovements:
         # But synthesized prompt from selection is used
         assert result["rewritten_prompt"] == "Synthesized prompt"
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     async def test_exception_returns_none(self, mock_invoke):
         mock_invoke.side_effect = RuntimeError("LLM error")
@@ -164,7 +156,6 @@ class TestGenerateToTImprovements:
 
 
 class TestGenerateImprovementsWithToT:
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.retrieve_context", new_callable=AsyncMock, return_value="")
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.improver.get_llm")
@@ -194,7 +185,6 @@ class TestGenerateImprovementsWithToT:
         assert result["rewritten_prompt"] == "Synthesized best prompt"
         assert result["tot_branches_data"] is not None
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.retrieve_context", new_callable=AsyncMock, return_value="")
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.improver.get_llm")
@@ -221,7 +211,6 @@ class TestGenerateImprovementsWithToT:
         result = await generate_improvements(state)
         assert result["rewritten_prompt"] == "Synthesized best prompt"
 
-    @pytest.mark.asyncio
     @patch("src.agent.nodes.improver.retrieve_context", new_callable=AsyncMock, return_value="")
     @patch("src.agent.nodes.improver.invoke_structured", new_callable=AsyncMock)
     @patch("src.agent.nodes.improver.get_llm")